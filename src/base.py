@@ -12,6 +12,9 @@ Changes made:
 - Minor helpers unchanged except adjusted to work with deletion semantics
 """
 from __future__ import annotations
+import array
+import bisect
+import codecs
 import os
 import sys
 import json
@@ -22,10 +25,29 @@ from datetime import datetime
 from pathlib import Path
 from difflib import SequenceMatcher
 from typing import List, Tuple, Dict, Optional, Set
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import bsdiff4
+try:
+    import zstandard as zstd
+except ImportError:
+    zstd = None
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import numba
+    import numpy as np
+except ImportError:
+    numba = None
 import uuid
-import base64
 import tempfile
+import threading
 
 # -------------------------
 # Configuration / Paths
@@ -35,6 +57,7 @@ OBJECTS_DIR = "objects"
 INDEX_FILE = "index.json"
 METADATA_FILE = "metadata.json"
 CONFIG_FILE = "config.json"
+DICT_FILE = "dict.zstd"
 
 # -------------------------
 # Low-level utilities
@@ -48,13 +71,216 @@ def compress_data(data: bytes) -> bytes:
 def decompress_data(data: bytes) -> bytes:
     return zlib.decompress(data)
 
+# -------------------------
+# Shared-dictionary object compression
+# -------------------------
+# Once a repo has accumulated enough objects, a zstd dictionary trained on
+# them compresses the many small objects (commit JSONs, tiny diffs) far
+# better than standalone zlib. Object files carry a one-byte format tag:
+# 0x01 = zstd + repo dictionary, 0x00 = plain zlib. Legacy untagged objects
+# (zlib streams start with 0x78) are still readable.
+_TAG_ZLIB = b"\x00"
+_TAG_ZSTD_DICT = b"\x01"
+
+# Per-repo cache of the trained ZstdCompressionDict; None means "no dict
+# yet". The dictionary itself is shareable across threads, but
+# ZstdCompressor/ZstdDecompressor instances are not — save_object /
+# load_object run inside thread pools, and hammering one shared pair from
+# several workers corrupts its internal buffers. Each thread therefore
+# builds its own (compressor, decompressor) pair from the shared dict.
+_dict_cache: Dict[str, Optional["zstd.ZstdCompressionDict"]] = {}
+_codec_local = threading.local()
+
+def _get_dict_codecs(repo_path: str):
+    if zstd is None:
+        return None
+    if repo_path not in _dict_cache:
+        dict_path = os.path.join(repo_path, DICT_FILE)
+        if os.path.exists(dict_path):
+            _dict_cache[repo_path] = zstd.ZstdCompressionDict(Path(dict_path).read_bytes())
+        else:
+            _dict_cache[repo_path] = None
+    dict_data = _dict_cache[repo_path]
+    if dict_data is None:
+        return None
+    per_thread = getattr(_codec_local, "codecs", None)
+    if per_thread is None:
+        per_thread = _codec_local.codecs = {}
+    cached = per_thread.get(repo_path)
+    # Rebuild when the repo's dictionary object changed (e.g. retrained).
+    if cached is None or cached[0] is not dict_data:
+        cached = (
+            dict_data,
+            zstd.ZstdCompressor(level=3, dict_data=dict_data),
+            zstd.ZstdDecompressor(dict_data=dict_data),
+        )
+        per_thread[repo_path] = cached
+    return cached[1], cached[2]
+
+def compress_object(repo_path: str, data: bytes) -> bytes:
+    codecs_pair = _get_dict_codecs(repo_path)
+    if codecs_pair is not None:
+        return _TAG_ZSTD_DICT + codecs_pair[0].compress(data)
+    return _TAG_ZLIB + compress_data(data)
+
+def decompress_object(repo_path: str, blob: bytes) -> bytes:
+    if blob[:1] == _TAG_ZSTD_DICT:
+        codecs_pair = _get_dict_codecs(repo_path)
+        if codecs_pair is None:
+            raise ValueError("Object is dict-compressed but no repo dictionary found")
+        return codecs_pair[1].decompressobj().decompress(blob[1:])
+    if blob[:1] == _TAG_ZLIB:
+        return decompress_data(blob[1:])
+    # legacy object written before format tags existed
+    return decompress_data(blob)
+
+_utf8_decoder_factory = codecs.lookup("utf-8").incrementaldecoder
+
+# Bytes that may appear in text: BEL/BS/TAB/LF/FF/CR/ESC plus everything
+# printable, excluding DEL. Used as a translate() delete table below.
+_TEXTCHARS = bytes({7, 8, 9, 10, 12, 13, 27} | set(range(0x20, 0x100)) - {0x7f})
+
 def is_text_content(data: bytes) -> bool:
+    # Only inspect the first 8 KiB (like git's buffer_is_binary) instead of
+    # decoding the whole file into a throwaway str. translate() with a
+    # delete table is a single C pass over the head: any surviving byte is
+    # a NUL or stray control character -> binary. A clean all-ASCII head is
+    # text with no further work; heads with high bytes still get an
+    # incremental UTF-8 validation (final=False tolerates a multibyte
+    # sequence cut off at the window edge) so callers can safely decode.
+    head = data[:8192]
+    if head.translate(None, _TEXTCHARS):
+        return False
+    if head.isascii():
+        return True
     try:
-        data.decode("utf-8")
+        _utf8_decoder_factory().decode(head, final=False)
         return True
-    except Exception:
+    except UnicodeDecodeError:
         return False
 
+def atomic_write(path: str, data: bytes):
+    """
+    Write data to path via a temp file in the same directory + os.replace,
+    so a crash mid-write never leaves a half-written object/metadata file.
+    Durability is batched: callers that need an fsync barrier (commit) call
+    sync_writes() once instead of flushing every individual write.
+    """
+    directory = os.path.dirname(path) or "."
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".gible-tmp-")
+    try:
+        os.write(fd, data)
+        os.close(fd)
+        fd = -1  # closed; the descriptor number may be reused by another thread
+        os.replace(tmp_path, path)
+    except Exception:
+        if fd != -1:
+            try:
+                os.close(fd)
+            except Exception:
+                pass
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def safe_unlink(path: str) -> None:
+    # One unlink syscall instead of the stat+unlink exists/remove pair.
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+    except OSError:
+        pass
+
+def write_if_changed(path, data: bytes) -> None:
+    # Skip the write (and its fsync pressure) when the file already holds
+    # exactly these bytes, as happens for most files in merges/restores.
+    p = Path(path)
+    try:
+        if p.stat().st_size == len(data) and p.read_bytes() == data:
+            return
+    except OSError:
+        pass
+    p.write_bytes(data)
+
+# orjson (C extension) encodes/decodes several times faster than stdlib
+# json; the on-disk format is identical either way, so stdlib remains the
+# fallback when it isn't installed.
+def json_dumps_pretty(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+def json_dumps_compact(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+def json_loads(data: bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def write_json(path: str, obj) -> None:
+    # One-shot encode, then a single write(2) on a raw fd. Skipping the
+    # TextIOWrapper avoids its intermediate encoding buffer; the payload is
+    # already UTF-8 bytes.
+    payload = json_dumps_pretty(obj)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, payload)
+    finally:
+        os.close(fd)
+
+def sync_writes():
+    """Single flush barrier, called once per commit instead of per write."""
+    if hasattr(os, "sync"):
+        try:
+            os.sync()
+        except Exception:
+            pass
+
+# -------------------------
+# Working-tree traversal
+# -------------------------
+def iter_working_files(root: str):
+    """
+    Iterative scandir walk yielding file paths under root, never descending
+    into .gible. scandir reuses the dirent type info, so this does roughly
+    half the stat() calls of os.walk on large trees.
+    """
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name != GIBLE_REPO_DIR:
+                        stack.append(entry.path)
+                elif entry.is_file():
+                    # Follow symlinks for the file check so a link to a file
+                    # is tracked like the file itself; only directory descent
+                    # stays no-follow, to avoid walking into link loops.
+                    yield entry.path
+
+def _rmtree_parallel(root: str) -> None:
+    """
+    Delete a directory tree with pooled unlinks. shutil.rmtree walks and
+    unlinks serially, which dominates destroy time once the object store
+    holds many blobs; unlink syscalls overlap well, so files in each
+    directory are removed through a thread pool and the directories
+    themselves bottom-up afterwards. Anything left over (unexpected
+    entries, races) is swept up by a final shutil.rmtree.
+    """
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+        for dirpath, dirnames, filenames in os.walk(root, topdown=False):
+            list(ex.map(safe_unlink, (os.path.join(dirpath, n) for n in filenames)))
+            try:
+                os.rmdir(dirpath)
+            except OSError:
+                pass
+    if os.path.exists(root):
+        shutil.rmtree(root)
+
 # -------------------------
 # Object storage
 # -------------------------
@@ -64,9 +290,12 @@ def objects_dir(repo_path: str) -> str:
 def save_object(repo_path: str, data: bytes, obj_type: str) -> str:
     oid = calculate_hash(data)
     obj_path = os.path.join(objects_dir(repo_path), f"{oid}.{obj_type}")
+    if os.path.exists(obj_path):
+        # Content-addressed: an object with this oid already holds exactly
+        # these bytes, so skip the compress + write entirely.
+        return oid
     os.makedirs(os.path.dirname(obj_path), exist_ok=True)
-    with open(obj_path, "wb") as f:
-        f.write(compress_data(data))
+    atomic_write(obj_path, compress_object(repo_path, data))
     return oid
 
 def load_object(repo_path: str, oid: str, obj_type: str) -> bytes:
@@ -74,7 +303,7 @@ def load_object(repo_path: str, oid: str, obj_type: str) -> bytes:
     if not os.path.exists(obj_path):
         raise FileNotFoundError(f"Object {oid}.{obj_type} not found")
     with open(obj_path, "rb") as f:
-        return decompress_data(f.read())
+        return decompress_object(repo_path, f.read())
 
 # -------------------------
 # Text diff generation/application
@@ -90,11 +319,11 @@ def generate_text_diff(old_bytes: bytes, new_bytes: bytes) -> bytes:
             patch.append([tag, i1, i2, j1, j2, new_lines[j1:j2]])
         else:
             patch.append([tag, i1, i2, j1, j2, None])
-    return json.dumps(patch, ensure_ascii=False).encode('utf-8')
+    return json_dumps_compact(patch)
 
 def apply_text_diff(base_bytes: bytes, diff_bytes: bytes) -> bytes:
     base_lines = base_bytes.decode('utf-8').splitlines(keepends=True)
-    patch = json.loads(diff_bytes.decode('utf-8'))
+    patch = json_loads(diff_bytes)
     result_lines: List[str] = []
     for entry in patch:
         tag, i1, i2, j1, j2, new_chunk = entry
@@ -110,15 +339,162 @@ def apply_text_diff(base_bytes: bytes, diff_bytes: bytes) -> bytes:
             raise ValueError(f"Unknown opcode tag: {tag}")
     return "".join(result_lines).encode('utf-8')
 
+# -------------------------
+# Myers diff (used by three-way merge)
+# -------------------------
+# When numba is present the k-frontier forward pass runs as native code
+# over int32 arrays; otherwise a flat-array pure-Python pass is used. The
+# compiled path only kicks in for inputs big enough to amortize the array
+# conversion (and first-call compile, which numba caches on disk).
+_NUMBA_MIN_LINES = 256
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _myers_forward_numba(a, b):  # pragma: no cover - exercised when numba installed
+        n, m = len(a), len(b)
+        size = 2 * (n + m) + 1
+        off = n + m
+        v = np.zeros(size, np.int32)
+        trace = [v.copy()]
+        found = False
+        for d in range(n + m + 1):
+            if d > 0:
+                trace.append(v.copy())
+            for k in range(-d, d + 1, 2):
+                if k == -d or (k != d and v[k - 1 + off] < v[k + 1 + off]):
+                    x = v[k + 1 + off]
+                else:
+                    x = v[k - 1 + off] + 1
+                y = x - k
+                while x < n and y < m and a[x] == b[y]:
+                    x += 1
+                    y += 1
+                v[k + off] = x
+                if x >= n and y >= m:
+                    found = True
+                    break
+            if found:
+                break
+        return trace
+else:
+    _myers_forward_numba = None
+
+def _myers_forward_py(a, b, n: int, m: int):
+    off = n + m
+    v = array.array('i', bytes(4 * (2 * (n + m) + 1)))
+    trace = []
+    found = False
+    for d in range(n + m + 1):
+        trace.append(v[:])
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and v[k - 1 + off] < v[k + 1 + off]):
+                x = v[k + 1 + off]
+            else:
+                x = v[k - 1 + off] + 1
+            y = x - k
+            while x < n and y < m and a[x] == b[y]:
+                x += 1
+                y += 1
+            v[k + off] = x
+            if x >= n and y >= m:
+                found = True
+                break
+        if found:
+            break
+    return trace
+
+def myers_opcodes(a, b) -> List[Tuple[str, int, int, int, int]]:
+    """
+    Myers O(ND) shortest-edit-script diff returning SequenceMatcher-style
+    opcodes (tag, i1, i2, j1, j2). Unlike difflib's LCS heuristic this stays
+    fast on large, highly divergent inputs; adjacent delete+insert runs are
+    coalesced into 'replace' so callers see the same opcode shapes.
+    """
+    n, m = len(a), len(b)
+    if n == 0 and m == 0:
+        return []
+    off = n + m
+    if _myers_forward_numba is not None and n + m >= _NUMBA_MIN_LINES:
+        trace = _myers_forward_numba(np.asarray(a, np.int32), np.asarray(b, np.int32))
+    else:
+        trace = _myers_forward_py(a, b, n, m)
+
+    # backtrack into raw per-element ops (reversed)
+    ops: List[Tuple[str, int, int]] = []  # (tag, i, j) with tag in equal/delete/insert
+    x, y = n, m
+    for d in range(len(trace) - 1, -1, -1):
+        vd = trace[d]
+        k = x - y
+        if k == -d or (k != d and vd[k - 1 + off] < vd[k + 1 + off]):
+            prev_k = k + 1
+        else:
+            prev_k = k - 1
+        prev_x = vd[prev_k + off]
+        prev_y = prev_x - prev_k
+        while x > prev_x and y > prev_y:
+            ops.append(("equal", x - 1, y - 1))
+            x -= 1
+            y -= 1
+        if d > 0:
+            if x == prev_x:
+                ops.append(("insert", x, y - 1))
+                y -= 1
+            else:
+                ops.append(("delete", x - 1, y))
+                x -= 1
+    ops.reverse()
+
+    # coalesce runs into opcodes, merging touching delete+insert into replace
+    opcodes: List[List] = []
+    i = j = 0
+    for tag, oi, oj in ops:
+        if tag == "equal":
+            i, j = oi + 1, oj + 1
+            if opcodes and opcodes[-1][0] == "equal":
+                opcodes[-1][2], opcodes[-1][4] = i, j
+            else:
+                opcodes.append(["equal", oi, i, oj, j])
+        elif tag == "delete":
+            i = oi + 1
+            if opcodes and opcodes[-1][0] in ("delete", "replace") and opcodes[-1][2] == oi:
+                opcodes[-1][2] = i
+            elif opcodes and opcodes[-1][0] == "insert" and opcodes[-1][2] == oi:
+                opcodes[-1][0], opcodes[-1][2] = "replace", i
+            else:
+                opcodes.append(["delete", oi, i, oj, oj])
+        else:  # insert
+            j = oj + 1
+            if opcodes and opcodes[-1][0] in ("insert", "replace") and opcodes[-1][4] == oj:
+                opcodes[-1][4] = j
+            elif opcodes and opcodes[-1][0] == "delete" and opcodes[-1][4] == oj:
+                opcodes[-1][0], opcodes[-1][4] = "replace", j
+            else:
+                opcodes.append(["insert", oi, oi, oj, j])
+    return [tuple(op) for op in opcodes]
+
 # -------------------------
 # Binary diff support
 # -------------------------
+# bsdiff4's suffix-sort is slow and memory-hungry on large inputs, so files
+# above this size use a zstd dictionary diff ("zdiff" objects) when the
+# zstandard module is available; bsdiff4 stays the default for small deltas
+# where its header overhead is lower.
+LARGE_BINARY_THRESHOLD = 1 << 20
+
 def generate_binary_diff(old_bytes: bytes, new_bytes: bytes) -> bytes:
     return bsdiff4.diff(old_bytes, new_bytes)
 
 def apply_binary_diff(base_bytes: bytes, diff_bytes: bytes) -> bytes:
     return bsdiff4.patch(base_bytes, diff_bytes)
 
+def generate_zstd_diff(old_bytes: bytes, new_bytes: bytes) -> bytes:
+    cctx = zstd.ZstdCompressor(dict_data=zstd.ZstdCompressionDict(old_bytes))
+    return cctx.compress(new_bytes)
+
+def apply_zstd_diff(base_bytes: bytes, diff_bytes: bytes) -> bytes:
+    dctx = zstd.ZstdDecompressor(dict_data=zstd.ZstdCompressionDict(base_bytes))
+    return dctx.decompressobj().decompress(diff_bytes)
+
 # -------------------------
 # Index (staging) management
 # -------------------------
@@ -132,20 +508,25 @@ class GibleIndex:
     def _load(self):
         if os.path.exists(self.index_filepath):
             try:
-                with open(self.index_filepath, "r", encoding='utf-8') as f:
-                    self._data = json.load(f)
+                with open(self.index_filepath, "rb") as f:
+                    self._data = json_loads(f.read())
             except Exception:
                 self._data = {}
 
     def _save(self):
         os.makedirs(os.path.dirname(self.index_filepath), exist_ok=True)
-        with open(self.index_filepath, "w", encoding='utf-8') as f:
-            json.dump(self._data, f, indent=2, ensure_ascii=False)
+        atomic_write(self.index_filepath, json_dumps_pretty(self._data))
 
     def add_file(self, filepath: str, file_hash: str, mode: str):
         self._data[filepath] = {"hash": file_hash, "mode": mode}
         self._save()
 
+    def add_files(self, entries: List[Tuple[str, str, str]]):
+        """Batch variant of add_file: one save for many staged files."""
+        for filepath, file_hash, mode in entries:
+            self._data[filepath] = {"hash": file_hash, "mode": mode}
+        self._save()
+
     def remove_file(self, filepath: str):
         if filepath in self._data:
             del self._data[filepath]
@@ -169,7 +550,17 @@ class GibleRepository:
         self.index = GibleIndex(self.repo_path)
         self.metadata_filepath = os.path.join(self.repo_path, METADATA_FILE)
         self.config_filepath = os.path.join(self.repo_path, CONFIG_FILE)
-        self.output_buffer: List[str] = [] # Add this line
+        # UI mode assigns a list here to capture log lines; None means CLI
+        # mode and _log falls through to stderr instead of buffering.
+        self.output_buffer: Optional[List[str]] = None
+        # Memoized {commit_oid: files_map}; commit trees are immutable once
+        # written, so entries stay valid until new commits are created.
+        self._tree_cache: Dict[str, Dict[str, List]] = {}
+        # Memoized decoded commit objects, same immutability argument.
+        self._commit_cache: Dict[str, dict] = {}
+        # Parsed metadata.json cache, validated by file mtime on each load.
+        self._metadata_cache: Optional[dict] = None
+        self._metadata_mtime: Optional[int] = None
 
     # -------------------------
     # Initialization
@@ -180,56 +571,86 @@ class GibleRepository:
             return {"success": False, "message": "Repository already initialized."} # Modified
         os.makedirs(self.objects_path, exist_ok=True)
         initial_config = {
-            "version": "0.5.0-deletion-support",
+            "version": "0.6.0-msgpack-commits",
             "created_at": datetime.now().isoformat(),
             "author": os.getenv("USER") or os.getenv("USERNAME") or "unknown"
         }
-        with open(self.config_filepath, "w", encoding='utf-8') as f:
-            json.dump(initial_config, f, indent=2, ensure_ascii=False)
+        atomic_write(self.config_filepath, json_dumps_pretty(initial_config))
         initial_metadata = {
             "head": None,
             "current_branch": "master",
             "branches": {"master": None},
             "commits": {}
         }
-        with open(self.metadata_filepath, "w", encoding='utf-8') as f:
-            json.dump(initial_metadata, f, indent=2, ensure_ascii=False)
+        self.save_metadata(initial_metadata)
         self.index.clear()
         self._log(f"Initialized Gible repository at {self.repo_path}")
         return {"success": True, "message": "Repository initialized successfully."} # Modified
     
     def _log(self, message: str):
-        if hasattr(self, 'output_buffer'): # Check if running in UI mode
+        if self.output_buffer is not None: # Running in UI mode
             self.output_buffer.append(message)
+            # Keep the buffer bounded during large commits / long sessions
+            if len(self.output_buffer) > 10000:
+                del self.output_buffer[:5000]
         else:
-            self._log(message)
+            print(message, file=sys.stderr)
     
     def is_repo(self) -> bool:
         return os.path.isdir(self.repo_path) and os.path.isdir(self.objects_path) and os.path.isfile(self.config_filepath)
 
     def load_metadata(self) -> dict:
-        if not os.path.exists(self.metadata_filepath):
+        # Hot paths call this several times per operation; re-parse the JSON
+        # only when the file's mtime says someone else rewrote it.
+        try:
+            mtime = os.stat(self.metadata_filepath).st_mtime_ns
+        except OSError:
             raise Exception("Not a Gible repository (metadata missing).")
-        with open(self.metadata_filepath, "r", encoding='utf-8') as f:
-            return json.load(f)
+        if self._metadata_cache is not None and mtime == self._metadata_mtime:
+            return self._metadata_cache
+        with open(self.metadata_filepath, "rb") as f:
+            metadata = json_loads(f.read())
+        self._metadata_cache = metadata
+        self._metadata_mtime = mtime
+        return metadata
 
     def save_metadata(self, metadata: dict):
-        with open(self.metadata_filepath, "w", encoding='utf-8') as f:
-            json.dump(metadata, f, indent=2, ensure_ascii=False)
+        atomic_write(self.metadata_filepath, json_dumps_pretty(metadata))
+        self._metadata_cache = metadata
+        try:
+            self._metadata_mtime = os.stat(self.metadata_filepath).st_mtime_ns
+        except OSError:
+            self._metadata_mtime = None
+
+    def _load_metadata_for_update(self) -> dict:
+        # Callers mutate the returned dict in place before calling
+        # save_metadata(). Drop the cache first: if the operation fails
+        # between the mutation and the save, a cached half-updated dict
+        # would disagree with what is actually on disk.
+        metadata = self.load_metadata()
+        self._metadata_cache = None
+        return metadata
 
     def load_config(self) -> dict:
         if not os.path.exists(self.config_filepath):
             raise Exception("Not a Gible repository (config missing).")
-        with open(self.config_filepath, "r", encoding='utf-8') as f:
-            return json.load(f)
+        with open(self.config_filepath, "rb") as f:
+            return json_loads(f.read())
 
     # -------------------------
     # Commit storage
     # -------------------------
     def _write_commit_object(self, commit_obj: dict) -> str:
-        commit_bytes = json.dumps(commit_obj, indent=2, ensure_ascii=False).encode('utf-8')
+        # Commit objects are internal, not human-edited, so they are stored
+        # as MessagePack (or compact JSON when msgpack is unavailable) rather
+        # than indented JSON, which roughly halves their size and decodes
+        # much faster. metadata.json / config.json stay human-readable JSON.
+        if msgpack is not None:
+            commit_bytes = msgpack.packb(commit_obj, use_bin_type=True)
+        else:
+            commit_bytes = json_dumps_compact(commit_obj)
         oid = save_object(self.repo_path, commit_bytes, "commit")
-        metadata = self.load_metadata()
+        metadata = self._load_metadata_for_update()
         metadata["commits"][oid] = {
             "message": commit_obj.get("message", ""),
             "timestamp": commit_obj.get("timestamp"),
@@ -241,21 +662,43 @@ class GibleRepository:
         metadata["branches"][current_branch] = oid
         metadata["head"] = oid
         self.save_metadata(metadata)
+        self._tree_cache.pop(oid, None)
         return oid
 
+    def _get_commit_header(self, oid: str, metadata: Optional[dict] = None) -> dict:
+        """
+        Return the message/timestamp/author/parent fields for oid without
+        decoding the commit object. metadata.json mirrors these header
+        fields per commit, so a log walk needs no object loads at all.
+        """
+        if metadata is None:
+            metadata = self.load_metadata()
+        entry = metadata["commits"].get(oid)
+        if entry is not None:
+            return entry
+        return self._get_full_commit(oid)
+
     def _get_full_commit(self, oid: str) -> dict:
         if not isinstance(oid, str): # Add this type check
             raise ValueError(f"Invalid commit OID type: Expected string, got {type(oid).__name__} ({oid})")
-        
+
+        cached = self._commit_cache.get(oid)
+        if cached is not None:
+            return cached
         try:
             commit_bytes = load_object(self.repo_path, oid, "commit")
-            return json.loads(commit_bytes.decode('utf-8'))
+            # JSON commits (legacy and msgpack-less fallback) start with '{';
+            # a msgpack-encoded map never does.
+            if commit_bytes[:1] == b"{":
+                commit_obj = json_loads(commit_bytes)
+            else:
+                commit_obj = msgpack.unpackb(commit_bytes, raw=False)
         except FileNotFoundError:
             metadata = self.load_metadata()
             meta_entry = metadata["commits"].get(oid)
             if not meta_entry:
                 raise FileNotFoundError(f"Commit object {oid} not found in metadata or as file.")
-            return {
+            commit_obj = {
                 "hash": oid,
                 "parent": meta_entry.get("parent"),
                 "message": meta_entry.get("message"),
@@ -263,10 +706,34 @@ class GibleRepository:
                 "timestamp": meta_entry.get("timestamp"),
                 "files": meta_entry.get("files", {})
             }
+        self._commit_cache[oid] = commit_obj
+        return commit_obj
 
     # -------------------------
     # File reconstruction
     # -------------------------
+    # Cap on consecutive diff objects for one file before a fresh base
+    # snapshot is stored, so reconstruction replays at most this many
+    # deltas instead of the whole history (cf. git's delta depth limit).
+    MAX_DELTA_CHAIN = 10
+
+    def _delta_chain_length(self, commit_oid: Optional[str], filepath: str) -> int:
+        """Count diff entries for filepath since its most recent base snapshot."""
+        count = 0
+        current_oid = commit_oid
+        while current_oid:
+            commit_obj = self._get_full_commit(current_oid)
+            entry = commit_obj.get("files", {}).get(filepath)
+            if entry is not None:
+                if entry[0] in ("base", "deleted"):
+                    return count
+                count += 1
+            parent = commit_obj.get("parent")
+            if isinstance(parent, list):
+                parent = parent[0]
+            current_oid = parent
+        return count
+
     def reconstruct_file_bytes(self, commit_oid: str, filepath: str) -> Optional[bytes]:
         """
         Walk back from commit_oid through parents collecting chain entries for filepath.
@@ -306,7 +773,20 @@ class GibleRepository:
                 result = load_object(self.repo_path, oid, "base")
             elif obj_type == "diff":
                 diff_bytes = load_object(self.repo_path, oid, "diff")
-                result = apply_text_diff(result, diff_bytes) if is_text_content(result) else apply_binary_diff(result, diff_bytes)
+                if is_text_content(result):
+                    try:
+                        result = apply_text_diff(result, diff_bytes)
+                    except (UnicodeDecodeError, ValueError):
+                        # Head looked like text but the diff was stored as
+                        # binary (tail isn't UTF-8). bsdiff bytes fail the
+                        # JSON parse with a ValueError under orjson, and
+                        # with UnicodeDecodeError under stdlib json.
+                        result = apply_binary_diff(result, diff_bytes)
+                else:
+                    result = apply_binary_diff(result, diff_bytes)
+            elif obj_type == "zdiff":
+                diff_bytes = load_object(self.repo_path, oid, "zdiff")
+                result = apply_zstd_diff(result, diff_bytes)
             else:
                 raise ValueError(f"Unsupported object type in chain: {obj_type}")
         return result
@@ -315,7 +795,10 @@ class GibleRepository:
     # Staging / add
     # -------------------------
     def add(self, filepath: str):
-        abs_path = os.path.join(self.working_dir, filepath)
+        # normpath collapses '.', '..' and doubled separators up front so
+        # that non-canonical inputs (add('.') vs add('x.txt')) can't stage
+        # the same file under two different index keys.
+        abs_path = os.path.normpath(os.path.join(self.working_dir, filepath))
         if not os.path.exists(abs_path):
             self._log(f"Error: Path not found: {filepath}")
             return {"success": False, "message": f"Path not found: {filepath}"}
@@ -324,23 +807,32 @@ class GibleRepository:
         if os.path.isfile(abs_path):
             paths_to_process.append(abs_path)
         else:
-            for root, dirs, files in os.walk(abs_path, topdown=True):
-                dirs[:] = [d for d in dirs if d != GIBLE_REPO_DIR]
-                for name in files:
-                    paths_to_process.append(os.path.join(root, name))
-
-        staged_count = 0
-        for full_path in paths_to_process:
-            rel = os.path.relpath(full_path, self.working_dir)
+            paths_to_process.extend(iter_working_files(abs_path))
+
+        # Every path below came from joining/walking under working_dir, so
+        # the relative path is a constant-offset slice — os.path.relpath
+        # would redo a normpath + commonprefix per file for the same answer.
+        prefix_len = len(os.path.join(self.working_dir, ""))
+
+        def _stage_one(full_path):
+            rel = full_path[prefix_len:]
             try:
                 data = Path(full_path).read_bytes()
             except Exception:
-                continue
+                return None
             mode = "text" if is_text_content(data) else "binary"
-            content_hash = calculate_hash(data)
-            self.index.add_file(rel, content_hash, mode)
+            return (rel, calculate_hash(data), mode)
+
+        # Reading + hashing is I/O bound and sha256 releases the GIL, so the
+        # per-file work scales across a thread pool; the index is updated once.
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+            results = list(ex.map(_stage_one, paths_to_process))
+
+        staged = [r for r in results if r is not None]
+        self.index.add_files(staged)
+        for rel, _, mode in staged:
             self._log(f"Staged: {rel} (mode: {mode})")
-            staged_count += 1
+        staged_count = len(staged)
 
         if staged_count == 0:
             return {"success": False, "message": f"No files staged for: {filepath}"}
@@ -350,7 +842,7 @@ class GibleRepository:
     # Commit
     # -------------------------
     def commit(self, message: str):
-        metadata = self.load_metadata()
+        metadata = self._load_metadata_for_update()
         head = metadata.get("head")
         current_branch = metadata.get("current_branch", "master")
         staged = self.index.get_all()
@@ -395,31 +887,31 @@ class GibleRepository:
         new_files_map = prev_files_map.copy()
 
         # 3. UPDATE WITH CHANGES
-        for filepath, info in combined_files.items():
+        # Each file's diff/compress/store is independent of the others (objects
+        # are content-addressed), so the per-file work runs in a thread pool;
+        # results and log lines are merged back on this thread afterwards.
+        def _commit_one(item):
+            filepath, info = item
             abs_path = os.path.join(self.working_dir, filepath)
 
             # CASE: Deleted on disk
             if not os.path.exists(abs_path):
-                # Mark as deleted. Depending on your restore logic, 
+                # Mark as deleted. Depending on your restore logic,
                 # you might want to keep this flag or remove the key entirely.
                 # Keeping it ensures restore_commit knows to delete the file.
-                new_files_map[filepath] = ["deleted", None]
-                self._log(f" {filepath}: deleted")
-                continue
+                return filepath, ["deleted", None], f" {filepath}: deleted"
 
             # CASE: Modified or New
             current_bytes = Path(abs_path).read_bytes()
             is_text = (info.get("mode") == "text")
-            
+
             # Get previous entry from the map we just loaded
             prev_entry = prev_files_map.get(filepath)
 
             # If this is a completely new file (not in previous commit)
             if prev_entry is None or prev_entry[0] == "deleted":
                 oid = save_object(self.repo_path, current_bytes, "base")
-                new_files_map[filepath] = ["base", oid]
-                self._log(f" {filepath}: stored base ({oid[:8]})")
-                continue
+                return filepath, ["base", oid], f" {filepath}: stored base ({oid[:8]})"
 
             # Reconstruct previous version for diffing
             try:
@@ -429,30 +921,55 @@ class GibleRepository:
 
             if last_bytes is None:
                 oid = save_object(self.repo_path, current_bytes, "base")
-                new_files_map[filepath] = ["base", oid]
-                self._log(f" {filepath}: stored base ({oid[:8]})")
-                continue
+                return filepath, ["base", oid], f" {filepath}: stored base ({oid[:8]})"
+
+            # Identical content: nothing to store, keep the old entry. A
+            # bytes comparison is a length check then one C-level memcmp —
+            # far cheaper than generating a diff to find out it's empty
+            # (binary files previously even stored a no-op delta).
+            if last_bytes == current_bytes:
+                return filepath, None, f" {filepath}: no changes (skipped)"
+
+            # Prune long delta chains: once this file has MAX_DELTA_CHAIN
+            # diffs since its last base, snapshot it so reconstruction stays
+            # O(chain cap) instead of O(history).
+            if self._delta_chain_length(head, filepath) >= self.MAX_DELTA_CHAIN:
+                oid = save_object(self.repo_path, current_bytes, "base")
+                return filepath, ["base", oid], f" {filepath}: stored base snapshot ({oid[:8]}, chain pruned)"
 
             if is_text:
-                diff_bytes = generate_text_diff(last_bytes, current_bytes)
-                if not json.loads(diff_bytes.decode('utf-8')):
-                    # No change detected, keep the old entry in new_files_map
-                    # (It is already there because we copied prev_files_map!)
-                    self._log(f" {filepath}: no changes (skipped)")
+                try:
+                    diff_bytes = generate_text_diff(last_bytes, current_bytes)
+                except UnicodeDecodeError:
+                    # The head-bounded text check can pass files whose tail
+                    # isn't valid UTF-8; store those as binary instead of
+                    # failing the commit.
+                    pass
                 else:
+                    if not json_loads(diff_bytes):
+                        # No change detected, keep the old entry in new_files_map
+                        # (It is already there because we copied prev_files_map!)
+                        return filepath, None, f" {filepath}: no changes (skipped)"
                     oid = save_object(self.repo_path, diff_bytes, "diff")
-                    new_files_map[filepath] = ["diff", oid]
-                    self._log(f" {filepath}: stored text diff ({oid[:8]})")
+                    return filepath, ["diff", oid], f" {filepath}: stored text diff ({oid[:8]})"
+
+            if zstd is not None and max(len(last_bytes), len(current_bytes)) > LARGE_BINARY_THRESHOLD:
+                bin_diff = generate_zstd_diff(last_bytes, current_bytes)
+                diff_type = "zdiff"
             else:
                 bin_diff = generate_binary_diff(last_bytes, current_bytes)
-                if len(bin_diff) < len(current_bytes):
-                    oid = save_object(self.repo_path, bin_diff, "diff")
-                    new_files_map[filepath] = ["diff", oid]
-                    self._log(f" {filepath}: stored binary diff ({oid[:8]})")
-                else:
-                    oid = save_object(self.repo_path, current_bytes, "base")
-                    new_files_map[filepath] = ["base", oid]
-                    self._log(f" {filepath}: stored binary base ({oid[:8]})")
+                diff_type = "diff"
+            if len(bin_diff) < len(current_bytes):
+                oid = save_object(self.repo_path, bin_diff, diff_type)
+                return filepath, [diff_type, oid], f" {filepath}: stored binary diff ({oid[:8]})"
+            oid = save_object(self.repo_path, current_bytes, "base")
+            return filepath, ["base", oid], f" {filepath}: stored binary base ({oid[:8]})"
+
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+            for filepath, entry, log_line in ex.map(_commit_one, combined_files.items()):
+                if entry is not None:
+                    new_files_map[filepath] = entry
+                self._log(log_line)
 
         # create the commit
         commit_obj = {
@@ -463,26 +980,55 @@ class GibleRepository:
             "timestamp": datetime.now().isoformat()
         }
     
+        # _write_commit_object records the commit header and advances the
+        # branch and HEAD in metadata itself; re-saving the dict loaded at
+        # the top of commit() here would clobber those header entries.
         commit_oid = self._write_commit_object(commit_obj)
 
-        # ---------------------------------------------------------
-        # Update the Branch and HEAD
-        # ---------------------------------------------------------
-        metadata["head"] = commit_oid
-        if current_branch:
-            metadata["branches"][current_branch] = commit_oid
-        
-        self.save_metadata(metadata)
-        # ---------------------------------------------------------
-
         self._log(f"[{current_branch}] {message}")
         self._log(f" commit {commit_oid}")
         
         self.index.clear()
         self._log("Staging area cleared.")
-        
+
+        self._maybe_train_compression_dict()
+
+        # One durability barrier for the whole commit instead of per-object flushes
+        sync_writes()
+
         return {"success": True, "commit_oid": commit_oid, "message": f"Committed: {commit_oid[:8]}"}
 
+    def _maybe_train_compression_dict(self):
+        """
+        Train a shared zstd dictionary on the repo's existing objects once
+        enough have accumulated, and persist it so later save_object calls
+        dict-compress. Best-effort: any failure just leaves zlib in place.
+        """
+        if zstd is None or os.path.exists(os.path.join(self.repo_path, DICT_FILE)):
+            return
+        try:
+            object_names = os.listdir(self.objects_path)
+        except OSError:
+            return
+        if len(object_names) < 16:
+            return
+        samples = []
+        for name in object_names[:256]:
+            try:
+                oid, _, obj_type = name.rpartition(".")
+                samples.append(load_object(self.repo_path, oid, obj_type))
+            except Exception:
+                continue
+        if len(samples) < 16:
+            return
+        try:
+            dict_bytes = zstd.train_dictionary(100_000, samples).as_bytes()
+        except Exception:
+            return
+        atomic_write(os.path.join(self.repo_path, DICT_FILE), dict_bytes)
+        _dict_cache.pop(self.repo_path, None)
+        self._log("Trained shared compression dictionary for object storage.")
+
     # -------------------------
     # Branch utilities / ancestors
     # -------------------------
@@ -515,7 +1061,7 @@ class GibleRepository:
         return result
     
     def create_branch(self, name: str):
-        metadata = self.load_metadata()
+        metadata = self._load_metadata_for_update()
         if name in metadata['branches']:
             self._log(f"Branch '{name}' already exists")
             return {"success": False, "message": f"Branch '{name}' already exists"} # Modified
@@ -525,7 +1071,7 @@ class GibleRepository:
         return {"success": True, "message": f"Branch '{name}' created."} # Modified
     
     def switch_branch(self, name: str, silent: bool = False):
-        metadata = self.load_metadata()
+        metadata = self._load_metadata_for_update()
         if name not in metadata['branches']:
             if not silent: self._log(f"Branch '{name}' does not exist")
             return {"success": False, "message": f"Branch '{name}' does not exist"}
@@ -554,10 +1100,10 @@ class GibleRepository:
         if not oid1 or not oid2:
             return None
         anc1 = self._all_ancestors(oid1)
-        q = [oid2]
+        q = deque([oid2])
         visited = set()
         while q:
-            x = q.pop(0)
+            x = q.popleft()
             if x is None or x in visited:
                 continue
             if x in anc1:
@@ -582,18 +1128,90 @@ class GibleRepository:
     # 3-way text merge helper
     # -------------------------
     def three_way_merge_text(self, base_lines: List[str], ours_lines: List[str], theirs_lines: List[str]) -> Tuple[str, bool]:
-        sm_ours = SequenceMatcher(None, base_lines, ours_lines)
-        sm_theirs = SequenceMatcher(None, base_lines, theirs_lines)
-
+        # Trim the lines common to all three versions at the head and tail
+        # first (same trick as git's xdiff): typical edits touch a small
+        # window, so both Myers passes then search only the changed middle.
+        n_base, n_ours, n_theirs = len(base_lines), len(ours_lines), len(theirs_lines)
+        p = min(n_base, n_ours, n_theirs)
+        head = 0
+        while head < p and base_lines[head] == ours_lines[head] == theirs_lines[head]:
+            head += 1
+        tail = 0
+        while tail < p - head and base_lines[n_base - 1 - tail] == ours_lines[n_ours - 1 - tail] == theirs_lines[n_theirs - 1 - tail]:
+            tail += 1
+        prefix = base_lines[:head]
+        suffix = base_lines[n_base - tail:] if tail else []
+        base_lines = base_lines[head:n_base - tail]
+        ours_lines = ours_lines[head:n_ours - tail]
+        theirs_lines = theirs_lines[head:n_theirs - tail]
+
+        # Intern every unique line to a small int id shared across all three
+        # versions, so the diff's inner equality checks are exact int
+        # compares (no hashing, no memcmp, no collision risk). Opcode
+        # indices are unaffected and the original line lists are still used
+        # to materialize output.
+        pool: Dict[str, int] = {}
+        base_h = array.array('i', (pool.setdefault(l, len(pool)) for l in base_lines))
+        ours_h = array.array('i', (pool.setdefault(l, len(pool)) for l in ours_lines))
+        theirs_h = array.array('i', (pool.setdefault(l, len(pool)) for l in theirs_lines))
+
+        # Vectorized fast path: when the trimmed middles are line-aligned
+        # (all three versions the same length), one NumPy compare per side
+        # classifies every line at once — no Myers diffs needed. numpy
+        # arrives with the optional numba dependency, hence that guard.
+        # Unaligned edits fall through to the diff-based path below.
+        if numba is not None and len(base_h) == len(ours_h) == len(theirs_h) and len(base_h):
+            base_arr = np.frombuffer(base_h, dtype=np.int32)
+            ours_eq = np.frombuffer(ours_h, dtype=np.int32) == base_arr
+            theirs_eq = np.frombuffer(theirs_h, dtype=np.int32) == base_arr
+            both_eq = np.frombuffer(ours_h, dtype=np.int32) == np.frombuffer(theirs_h, dtype=np.int32)
+            conflict_mask = (~(ours_eq | theirs_eq | both_eq)).tolist()
+            take_theirs = ours_eq.tolist()
+            result_lines = []
+            conflict = False
+            i = 0
+            n = len(base_h)
+            while i < n:
+                if conflict_mask[i]:
+                    # group adjacent conflicting lines into one marker block
+                    j = i
+                    while j < n and conflict_mask[j]:
+                        j += 1
+                    conflict = True
+                    result_lines.append("<<<<<<< HEAD\n")
+                    result_lines.extend(ours_lines[i:j])
+                    result_lines.append("=======\n")
+                    result_lines.extend(theirs_lines[i:j])
+                    result_lines.append(">>>>>>> MERGE_BRANCH\n")
+                    i = j
+                else:
+                    result_lines.append(theirs_lines[i] if take_theirs[i] else ours_lines[i])
+                    i += 1
+            return "".join(prefix) + "".join(result_lines) + "".join(suffix), conflict
+
+        # Width hunks (delete/replace) are resolved per covered interval
+        # below; zero-width hunks (pure insertions, i1 == i2) cover no
+        # interval at all, so they are kept in per-position maps and emitted
+        # between segments at their insertion boundary instead.
         modified_ours = []
         modified_theirs = []
+        inserted_ours: Dict[int, List[str]] = {}
+        inserted_theirs: Dict[int, List[str]] = {}
 
-        for tag, i1, i2, j1, j2 in sm_ours.get_opcodes():
-            if tag != "equal":
+        for tag, i1, i2, j1, j2 in myers_opcodes(base_h, ours_h):
+            if tag == "equal":
+                continue
+            if i1 == i2:
+                inserted_ours[i1] = ours_lines[j1:j2]
+            else:
                 modified_ours.append((i1, i2, ours_lines[j1:j2]))
 
-        for tag, i1, i2, j1, j2 in sm_theirs.get_opcodes():
-            if tag != "equal":
+        for tag, i1, i2, j1, j2 in myers_opcodes(base_h, theirs_h):
+            if tag == "equal":
+                continue
+            if i1 == i2:
+                inserted_theirs[i1] = theirs_lines[j1:j2]
+            else:
                 modified_theirs.append((i1, i2, theirs_lines[j1:j2]))
 
         boundaries = {0, len(base_lines)}
@@ -601,23 +1219,57 @@ class GibleRepository:
             boundaries.add(i1); boundaries.add(i2)
         for i1, i2, _ in modified_theirs:
             boundaries.add(i1); boundaries.add(i2)
+        boundaries.update(inserted_ours)
+        boundaries.update(inserted_theirs)
         sorted_bounds = sorted(boundaries)
 
-        def find_covering(seg_list, a, b):
+        def build_cover_map(seg_list):
+            # Index each hunk by the boundary intervals it covers so the
+            # per-interval lookup below is a dict hit instead of a linear
+            # scan over every hunk (O(M+B) total rather than O(M*B)).
+            cover: Dict[Tuple[int, int], List[str]] = {}
             for i1, i2, chunk in seg_list:
-                if i1 <= a and b <= i2:
-                    return chunk
-            return None
+                # Zero-width hunks cover no interval: lo == hi below and the
+                # chunk would be silently lost. They belong in the insertion
+                # maps, never here.
+                assert i1 < i2, "pure-insert hunk reached build_cover_map"
+                lo = bisect.bisect_left(sorted_bounds, i1)
+                hi = bisect.bisect_right(sorted_bounds, i2) - 1
+                for bi in range(lo, hi):
+                    cover[(sorted_bounds[bi], sorted_bounds[bi + 1])] = chunk
+            return cover
+
+        cover_ours = build_cover_map(modified_ours)
+        cover_theirs = build_cover_map(modified_theirs)
 
         result_lines: List[str] = []
         conflict = False
 
+        def emit_insertions(p):
+            nonlocal conflict
+            o = inserted_ours.get(p)
+            t = inserted_theirs.get(p)
+            if o is None and t is None:
+                return
+            if o is None:
+                result_lines.extend(t)
+            elif t is None or o == t:
+                result_lines.extend(o)
+            else:
+                conflict = True
+                result_lines.append("<<<<<<< HEAD\n")
+                result_lines.extend(o)
+                result_lines.append("=======\n")
+                result_lines.extend(t)
+                result_lines.append(">>>>>>> MERGE_BRANCH\n")
+
         for k in range(len(sorted_bounds) - 1):
             a = sorted_bounds[k]
             b = sorted_bounds[k+1]
+            emit_insertions(a)
             base_seg = base_lines[a:b]
-            ours_seg = find_covering(modified_ours, a, b)
-            theirs_seg = find_covering(modified_theirs, a, b)
+            ours_seg = cover_ours.get((a, b))
+            theirs_seg = cover_theirs.get((a, b))
 
             if ours_seg is None and theirs_seg is None:
                 result_lines.extend(base_seg)
@@ -636,13 +1288,15 @@ class GibleRepository:
                     result_lines.extend(theirs_seg)
                     result_lines.append(">>>>>>> MERGE_BRANCH\n")
 
-        return "".join(result_lines), conflict
+        emit_insertions(sorted_bounds[-1])
+
+        return "".join(prefix) + "".join(result_lines) + "".join(suffix), conflict
 
     # -------------------------
     # Merge
     # -------------------------
     def merge_branch(self, other_branch: str):
-        metadata = self.load_metadata()
+        metadata = self._load_metadata_for_update()
         if other_branch not in metadata['branches']:
             self._log(f"Branch '{other_branch}' does not exist")
             return
@@ -692,121 +1346,170 @@ class GibleRepository:
 
         merged_files: Dict[str, List[Optional[str]]] = {}
 
-        for f in all_files:
+        # The three trees share most history, so identical (commit, file)
+        # reconstructions are cached for the duration of this merge.
+        recon_cache: Dict[Tuple[Optional[str], str], Optional[bytes]] = {}
+
+        def _recon(commit_oid, f):
+            key = (commit_oid, f)
+            if key not in recon_cache:
+                try:
+                    recon_cache[key] = self.reconstruct_file_bytes(commit_oid, f)
+                except Exception:
+                    recon_cache[key] = None
+            return recon_cache[key]
+
+        # Dedupe blob stores within this merge: identical contents (e.g.
+        # ours == theirs across many files) hash and write only once.
+        oid_cache: Dict[bytes, str] = {}
+
+        def _existing_base_oid(entry) -> Optional[str]:
+            # A side stored as a plain base blob already has its bytes in the
+            # object store; reuse that oid instead of re-hashing and
+            # re-writing the identical content.
+            return entry[1] if entry is not None and entry[0] == "base" else None
+
+        def _save_base(data: bytes) -> str:
+            key = hashlib.blake2b(data, digest_size=16).digest()
+            oid = oid_cache.get(key)
+            if oid is None:
+                oid = save_object(self.repo_path, data, "base")
+                oid_cache[key] = oid
+            return oid
+
+        def _write_conflict(f, base, ours, theirs):
+            """Record a conflict for f under merge_dir. Text sides (str) are
+            inlined in the JSON; binary sides (bytes) are written raw as
+            side-car files (<stem>.base/.ours/.theirs) with only their path
+            and size in the JSON, avoiding the 33% base64 inflation. The
+            stem is a short path hash: separator-mangled names can collide
+            (a_b.txt vs a/b.txt), hashes cannot, and every conflict lands
+            flat in merge_dir with no per-file makedirs. The original path
+            stays in the JSON's "file" field."""
+            stem = os.path.join(merge_dir, hashlib.blake2b(f.encode("utf-8"), digest_size=8).hexdigest())
+            conflict_file = stem + ".json"
+            conflict_json = {"file": f, "status": "conflict"}
+            for side, data in (("base", base), ("ours", ours), ("theirs", theirs)):
+                if isinstance(data, bytes):
+                    side_path = stem + "." + side
+                    with open(side_path, "wb") as fh:
+                        fh.write(data)
+                    conflict_json[side] = None
+                    conflict_json[side + "_path"] = side_path
+                    conflict_json[side + "_size"] = len(data)
+                else:
+                    conflict_json[side] = data
+            write_json(conflict_file, conflict_json)
+
+        # Each file's resolution touches only its own working-tree path and
+        # conflict file, and blob stores are content-addressed, so the
+        # per-file work runs in a thread pool. Results are folded into
+        # merged_files / conflict_occurred on this thread afterwards.
+        def _merge_one(f):
+            """Resolve one path; returns (merged entry or None, had_conflict)."""
+            abs_path = os.path.join(self.working_dir, f)
             base_entry = files_base.get(f)
             ours_entry = files_current.get(f)
             theirs_entry = files_other.get(f)
 
-            # Determine deletion presence quickly from entries
-            base_deleted = (base_entry is not None and base_entry[0] == "deleted")
-            ours_deleted = (ours_entry is not None and ours_entry[0] == "deleted")
-            theirs_deleted = (theirs_entry is not None and theirs_entry[0] == "deleted")
-
             # reconstruct bytes (None signals deleted)
             try:
-                base_bytes = None if base_entry is None else (None if base_entry[0] == "deleted" else (load_object(self.repo_path, base_entry[1], "base") if base_entry[0] == "base" else self.reconstruct_file_bytes(base_head, f)))
+                base_bytes = None if base_entry is None else (None if base_entry[0] == "deleted" else (load_object(self.repo_path, base_entry[1], "base") if base_entry[0] == "base" else _recon(base_head, f)))
             except Exception:
                 base_bytes = None
-            try:
-                ours_bytes = None if ours_entry is None else (None if ours_entry[0] == "deleted" else self.reconstruct_file_bytes(current_head, f))
-            except Exception:
-                ours_bytes = None
-            try:
-                theirs_bytes = None if theirs_entry is None else (None if theirs_entry[0] == "deleted" else self.reconstruct_file_bytes(other_head, f))
-            except Exception:
-                theirs_bytes = None
+            ours_bytes = None if ours_entry is None or ours_entry[0] == "deleted" else _recon(current_head, f)
+            theirs_bytes = None if theirs_entry is None or theirs_entry[0] == "deleted" else _recon(other_head, f)
+
+            # Classify and decode each side once; the conflict writers and
+            # the merge branches below reuse these instead of re-scanning
+            # and re-decoding the same bytes.
+            def _as_text(side_bytes):
+                """(is_text, text) for one side. The head-bounded check can
+                flag files whose tail isn't valid UTF-8; those are demoted
+                to binary rather than raising."""
+                if side_bytes is None or not is_text_content(side_bytes):
+                    return False, None
+                try:
+                    return True, side_bytes.decode('utf-8')
+                except UnicodeDecodeError:
+                    return False, None
+
+            base_is_text, base_text = _as_text(base_bytes)
+            ours_is_text, ours_text = _as_text(ours_bytes)
+            theirs_is_text, theirs_text = _as_text(theirs_bytes)
 
             # HANDLE: both deleted or absent
             if (ours_entry is None or ours_bytes is None) and (theirs_entry is None or theirs_bytes is None):
                 # both deleted/absent -> omit from merged_files (deletion wins)
                 # ensure file removed from working tree
-                try:
-                    target = os.path.join(self.working_dir, f)
-                    if os.path.exists(target): os.remove(target)
-                except Exception:
-                    pass
-                continue
+                safe_unlink(abs_path)
+                return None, False
 
             # CASE: ours deleted, theirs not
             if (ours_entry is None or ours_bytes is None) and (theirs_entry is not None and theirs_bytes is not None):
                 # If theirs didn't change relative to base -> deletion wins
                 if base_bytes is not None and theirs_bytes == base_bytes:
-                    # deletion wins -> remove file
-                    try:
-                        t = os.path.join(self.working_dir, f)
-                        if os.path.exists(t): os.remove(t)
-                    except Exception:
-                        pass
-                    continue
-                else:
-                    # conflict: deleted by us, modified by them
-                    conflict_occurred = True
-                    conflict_file = os.path.join(merge_dir, f.replace(os.sep, "_") + ".json")
-                    os.makedirs(os.path.dirname(conflict_file), exist_ok=True)
-                    conflict_json = {"file": f, "status": "conflict", "base": base_bytes.decode('utf-8') if base_bytes and is_text_content(base_bytes) else (base64.b64encode(base_bytes).decode() if base_bytes else None), "ours": None, "theirs": theirs_bytes.decode('utf-8') if theirs_bytes and is_text_content(theirs_bytes) else (base64.b64encode(theirs_bytes).decode() if theirs_bytes else None)}
-                    with open(conflict_file, "w", encoding="utf-8") as mf:
-                        json.dump(conflict_json, mf, indent=2, ensure_ascii=False)
-                    # keep theirs in working tree for manual resolution
-                    if theirs_bytes is not None:
-                        Path(os.path.join(self.working_dir, f)).write_bytes(theirs_bytes)
-                        merged_files[f] = ["base", save_object(self.repo_path, theirs_bytes, "base")]
-                    continue
+                    safe_unlink(abs_path)
+                    return None, False
+                # conflict: deleted by us, modified by them
+                _write_conflict(f, base_text if base_is_text else base_bytes, None, theirs_text if theirs_is_text else theirs_bytes)
+                # keep theirs in working tree for manual resolution
+                write_if_changed(abs_path, theirs_bytes)
+                return ["base", _existing_base_oid(theirs_entry) or _save_base(theirs_bytes)], True
 
             # CASE: theirs deleted, ours not
             if (theirs_entry is None or theirs_bytes is None) and (ours_entry is not None and ours_bytes is not None):
                 # If ours didn't change relative to base -> deletion wins
                 if base_bytes is not None and ours_bytes == base_bytes:
-                    try:
-                        t = os.path.join(self.working_dir, f)
-                        if os.path.exists(t): os.remove(t)
-                    except Exception:
-                        pass
-                    continue
-                else:
-                    # conflict: modified by us, deleted by them
-                    conflict_occurred = True
-                    conflict_file = os.path.join(merge_dir, f.replace(os.sep, "_") + ".json")
-                    os.makedirs(os.path.dirname(conflict_file), exist_ok=True)
-                    conflict_json = {"file": f, "status": "conflict", "base": base_bytes.decode('utf-8') if base_bytes and is_text_content(base_bytes) else (base64.b64encode(base_bytes).decode() if base_bytes else None), "ours": ours_bytes.decode('utf-8') if ours_bytes and is_text_content(ours_bytes) else (base64.b64encode(ours_bytes).decode() if ours_bytes else None), "theirs": None}
-                    with open(conflict_file, "w", encoding="utf-8") as mf:
-                        json.dump(conflict_json, mf, indent=2, ensure_ascii=False)
-                    # keep ours in working tree
-                    if ours_bytes is not None:
-                        Path(os.path.join(self.working_dir, f)).write_bytes(ours_bytes)
-                        merged_files[f] = ["base", save_object(self.repo_path, ours_bytes, "base")]
-                    continue
+                    safe_unlink(abs_path)
+                    return None, False
+                # conflict: modified by us, deleted by them
+                _write_conflict(f, base_text if base_is_text else base_bytes, ours_text if ours_is_text else ours_bytes, None)
+                # keep ours in working tree
+                write_if_changed(abs_path, ours_bytes)
+                return ["base", _existing_base_oid(ours_entry) or _save_base(ours_bytes)], True
 
             # BOTH SIDES HAVE CONTENT -> normal merge
-            if ours_bytes is not None and theirs_bytes is not None:
-                if is_text_content(ours_bytes) and is_text_content(theirs_bytes):
-                    base_lines = base_bytes.decode("utf-8").splitlines(keepends=True) if base_bytes is not None else []
-                    ours_lines = ours_bytes.decode("utf-8").splitlines(keepends=True)
-                    theirs_lines = theirs_bytes.decode("utf-8").splitlines(keepends=True)
-
-                    merged_text, local_conflict = self.three_way_merge_text(base_lines, ours_lines, theirs_lines)
-                    merged_bytes = merged_text.encode("utf-8")
-                    if local_conflict:
-                        conflict_occurred = True
-                        conflict_file = os.path.join(merge_dir, f.replace(os.sep, "_") + ".json")
-                        os.makedirs(os.path.dirname(conflict_file), exist_ok=True)
-                        conflict_json = {"file": f, "status": "conflict", "base": "".join(base_lines), "ours": "".join(ours_lines), "theirs": "".join(theirs_lines)}
-                        with open(conflict_file, "w", encoding="utf-8") as mf:
-                            json.dump(conflict_json, mf, indent=2, ensure_ascii=False)
-                    Path(os.path.join(self.working_dir, f)).write_bytes(merged_bytes)
-                    merged_files[f] = ["base", save_object(self.repo_path, merged_bytes, "base")]
-                else:
-                    # binary or mixed
-                    if ours_bytes == theirs_bytes:
-                        merged_files[f] = ["base", save_object(self.repo_path, ours_bytes, "base")]
-                    else:
-                        conflict_occurred = True
-                        conflict_file = os.path.join(merge_dir, f.replace(os.sep, "_") + ".json")
-                        os.makedirs(os.path.dirname(conflict_file), exist_ok=True)
-                        conflict_json = {"file": f, "status": "conflict", "base": base64.b64encode(base_bytes).decode() if base_bytes else None, "ours": base64.b64encode(ours_bytes).decode(), "theirs": base64.b64encode(theirs_bytes).decode()}
-                        with open(conflict_file, "w", encoding="utf-8") as mf:
-                            json.dump(conflict_json, mf, indent=2, ensure_ascii=False)
-                        Path(os.path.join(self.working_dir, f)).write_bytes(ours_bytes)
-                        merged_files[f] = ["base", save_object(self.repo_path, ours_bytes, "base")]
+            if ours_is_text and theirs_is_text:
+                # Decode/split each side exactly once; the conflict writer
+                # below reuses the same strings instead of re-joining lines.
+                if not base_is_text:
+                    base_text = base_bytes.decode("utf-8", errors="replace") if base_bytes is not None else ""
+                base_lines = base_text.splitlines(keepends=True)
+                ours_lines = ours_text.splitlines(keepends=True)
+                theirs_lines = theirs_text.splitlines(keepends=True)
+
+                merged_text, local_conflict = self.three_way_merge_text(base_lines, ours_lines, theirs_lines)
+                merged_bytes = merged_text.encode("utf-8")
+                if local_conflict:
+                    _write_conflict(f, base_text, ours_text, theirs_text)
+                write_if_changed(abs_path, merged_bytes)
+                return ["base", _save_base(merged_bytes)], local_conflict
+
+            # binary or mixed
+            if ours_bytes == theirs_bytes:
+                return ["base", _existing_base_oid(ours_entry) or _save_base(ours_bytes)], False
+            _write_conflict(f, base_bytes, ours_bytes, theirs_bytes)
+            write_if_changed(abs_path, ours_bytes)
+            return ["base", _existing_base_oid(ours_entry) or _save_base(ours_bytes)], True
+
+        def _merge_task(f):
+            try:
+                entry, had_conflict = _merge_one(f)
+                return f, entry, had_conflict, None
+            except Exception as e:
+                return f, None, False, str(e)
+
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+            for f, entry, had_conflict, error in ex.map(_merge_task, all_files):
+                if error is not None:
+                    self._log(f"Merge failed for {f}: {error}")
+                    conflict_occurred = True
+                    continue
+                if entry is not None:
+                    merged_files[f] = entry
+                if had_conflict:
+                    conflict_occurred = True
 
         # If conflicts occurred: prompt user
         if conflict_occurred:
@@ -823,13 +1526,11 @@ class GibleRepository:
             "timestamp": datetime.now().isoformat()
         }
         
-        # If successful, commit_oid is a string and updates metadata correctly
+        # _write_commit_object records the merge commit's header and
+        # advances the branch and HEAD in metadata; saving the stale dict
+        # loaded above would wipe the header entries it just wrote.
         commit_oid = self._write_commit_object(merge_commit_obj)
         self._log(f"Merge commit created: {commit_oid} {'(with conflicts)' if conflict_occurred else '(no conflicts)'}")
-
-        metadata['branches'][current_branch] = commit_oid
-        metadata['head'] = commit_oid
-        self.save_metadata(metadata)
         self._log(f"Updated {current_branch} -> {commit_oid[:8]}")
         return {"success": True, "message": "Merge completed successfully."} # Modified
 
@@ -839,11 +1540,15 @@ class GibleRepository:
     def get_commit_tree(self, commit_oid: Optional[str]) -> dict:
         if not commit_oid:
             return {}
+        if commit_oid in self._tree_cache:
+            return self._tree_cache[commit_oid]
         try:
             commit_obj = self._get_full_commit(commit_oid)
-            return commit_obj.get("files", {})
+            files_map = commit_obj.get("files", {})
         except FileNotFoundError:
-            return {}
+            files_map = {}
+        self._tree_cache[commit_oid] = files_map
+        return files_map
 
     def restore_commit(self, commit_oid: str, silent: bool = False):    
         """
@@ -866,60 +1571,57 @@ class GibleRepository:
                 # safety: don't touch .gible
                 if GIBLE_REPO_DIR in Path(abs_path).parts:
                     continue
-                if os.path.exists(abs_path):
+                safe_unlink(abs_path)
+                # try removing empty parent directories; rmdir fails on
+                # non-empty ones, so no listdir scan is needed first
+                parent = os.path.dirname(abs_path)
+                while parent and parent != self.working_dir and parent.startswith(self.working_dir):
                     try:
-                        os.remove(abs_path)
-                    except Exception:
-                        pass
-                    # try removing empty parent directories
-                    parent = os.path.dirname(abs_path)
-                    while parent and parent != self.working_dir and parent.startswith(self.working_dir):
-                        try:
-                            if not os.listdir(parent):
-                                os.rmdir(parent)
-                            else:
-                                break
-                        except Exception:
-                            break
-                        parent = os.path.dirname(parent)
-
-        # Write files from commit (overwrites existing or creates new; handles 'deleted')
+                        os.rmdir(parent)
+                    except OSError:
+                        break
+                    parent = os.path.dirname(parent)
+
+        # Write files from commit (overwrites existing or creates new; handles
+        # 'deleted'). Entries are grouped by object type up front so each pass
+        # below is branch-free, and the independent base/diff writes run on a
+        # thread pool like add()/commit() do.
+        deleted_entries, base_entries, diff_entries = [], [], []
         for filepath, entry in files_map.items():
             obj_type, oid = entry[0], entry[1]
-
             abs_path = os.path.join(self.working_dir, filepath)
             # Create parent dirs
             os.makedirs(os.path.dirname(abs_path), exist_ok=True)
-
             if obj_type == "deleted":
-                # ensure file removed
-                if os.path.exists(abs_path):
-                    try:
-                        os.remove(abs_path)
-                    except Exception:
-                        pass
-                continue
+                deleted_entries.append(abs_path)
+            elif obj_type == "base":
+                base_entries.append((abs_path, oid))
+            elif obj_type in ("diff", "zdiff"):
+                diff_entries.append((abs_path, filepath))
 
-            if obj_type == "base":
-                data = load_object(self.repo_path, oid, "base")
-                Path(abs_path).write_bytes(data)
-                continue
+        # ensure deleted files removed
+        for abs_path in deleted_entries:
+            safe_unlink(abs_path)
 
-            if obj_type == "diff":
-                try:
-                    data = self.reconstruct_file_bytes(commit_oid, filepath)
-                except FileNotFoundError:
-                    data = None
-                if data is None:
-                    # resolved to deletion
-                    if os.path.exists(abs_path):
-                        try:
-                            os.remove(abs_path)
-                        except Exception:
-                            pass
-                else:
-                    Path(abs_path).write_bytes(data)
-                continue
+        def _restore_base(item):
+            abs_path, oid = item
+            write_if_changed(abs_path, load_object(self.repo_path, oid, "base"))
+
+        def _restore_diff(item):
+            abs_path, filepath = item
+            try:
+                data = self.reconstruct_file_bytes(commit_oid, filepath)
+            except FileNotFoundError:
+                data = None
+            if data is None:
+                # resolved to deletion
+                safe_unlink(abs_path)
+            else:
+                write_if_changed(abs_path, data)
+
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+            list(ex.map(_restore_base, base_entries))
+            list(ex.map(_restore_diff, diff_entries))
 
         
         if not silent: # Only log if not silent
@@ -952,7 +1654,7 @@ class GibleRepository:
         # confirm = input(f"This will permanently delete the Gible repository at {self.repo_path}.\nAre you sure? (y/n): ").strip().lower()
         # if confirm == 'y':
         try:
-            shutil.rmtree(self.repo_path)
+            _rmtree_parallel(self.repo_path)
             self._log(f"Gible repository at {self.repo_path} has been destroyed.")
             return {"success": True, "message": f"Gible repository at {self.repo_path} has been destroyed."} # Modified
         except Exception as e:
@@ -974,7 +1676,11 @@ class GibleRepository:
         metadata = self.load_metadata()
         return list(metadata["branches"].keys()) # Modified
 
-    def list_commits(self, branch_name: Optional[str] = None) -> List[Dict[str, str]]: # Modified signature
+    def list_commits(self, branch_name: Optional[str] = None, offset: int = 0,
+                     limit: Optional[int] = None) -> List[Dict[str, str]]: # Modified signature
+        """List commits newest-first. offset/limit bound the walk itself,
+        so asking for one page of a long history stops after that page
+        instead of traversing the whole chain."""
         metadata = self.load_metadata()
         head = metadata.get("head")
         if branch_name:
@@ -986,6 +1692,7 @@ class GibleRepository:
         # Add a check here just in case 'head' somehow got corrupted with a dict
         if not isinstance(head, str):
             self._log(f"Warning: Corrupted 'head' reference in metadata: {head}. Resetting to None.")
+            self._metadata_cache = None  # about to mutate the cached dict
             metadata["head"] = None
             if branch_name:
                 metadata["branches"][branch_name] = None
@@ -994,18 +1701,24 @@ class GibleRepository:
 
         commits_list: List[Dict[str, str]] = []
 
+        skipped = 0
         current_commit_oid = head
         while current_commit_oid:
-            # The type check in _get_full_commit will catch non-string parents.
-            # But the primary head should be clean here.
-            c = self._get_full_commit(current_commit_oid)
-            commits_list.append({
-                "oid": current_commit_oid,
-                "message": c.get("message", ""),
-                "timestamp": c.get("timestamp", ""),
-                "author": c.get("author", "unknown"),
-                "parent": c.get("parent")
-            })
+            # Header fields only — walking the log must not load and decode
+            # every commit's full file map.
+            c = self._get_commit_header(current_commit_oid, metadata)
+            if skipped < offset:
+                skipped += 1
+            else:
+                if limit is not None and len(commits_list) >= limit:
+                    break
+                commits_list.append({
+                    "oid": current_commit_oid,
+                    "message": c.get("message", ""),
+                    "timestamp": c.get("timestamp", ""),
+                    "author": c.get("author", "unknown"),
+                    "parent": c.get("parent")
+                })
             parent = c.get("parent")
             if isinstance(parent, list):
                 parent = parent[0]
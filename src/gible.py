@@ -1,5 +1,12 @@
+import functools
+import hashlib
+import platform
 import shutil
+import stat
+import subprocess
 import sys
+import threading
+import time
 import zipfile
 import customtkinter as ctk
 import tkinter as tk
@@ -7,12 +14,22 @@ from tkinter import ttk, simpledialog, filedialog
 import tkinter.messagebox as messagebox
 from pathlib import Path
 import json
-from functools import partial
+try:
+    import orjson
+except ImportError:
+    orjson = None
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import os
 
 # Gible
 from base import GibleRepository
 
+# Resolved once at import time; the file-manager launcher is then a single
+# Popen with no per-call platform.system() lookups.
+_PLATFORM = platform.system()
+_OPEN_CMD = {"Windows": ["explorer"], "Darwin": ["open"]}.get(_PLATFORM, ["xdg-open"])
+
 # -------------------------------
 # Persistent Repo Storage
 # -------------------------------
@@ -22,14 +39,159 @@ GIBLE_HOME.mkdir(exist_ok=True)
 INFO_FILE = GIBLE_HOME / "info.json"
 
 
+# orjson (C extension) parses and serializes the repo list far faster than
+# stdlib json; the file stays indented JSON either way, so the two are
+# interchangeable and stdlib remains the fallback. The parsed list is also
+# cached in memory keyed by file mtime — add/delete/import each call
+# load_repo_list several times and only the first needs to touch disk.
+_repo_list_cache = None
+_repo_list_mtime = None
+
+
 def load_repo_list():
-    if INFO_FILE.exists():
-        return json.loads(INFO_FILE.read_text())
-    return []
+    global _repo_list_cache, _repo_list_mtime
+    try:
+        mtime = INFO_FILE.stat().st_mtime_ns
+    except OSError:
+        return []
+    if _repo_list_cache is not None and mtime == _repo_list_mtime:
+        return _repo_list_cache
+    data = INFO_FILE.read_bytes()
+    _repo_list_cache = orjson.loads(data) if orjson is not None else json.loads(data)
+    _repo_list_mtime = mtime
+    return _repo_list_cache
 
 
 def save_repo_list(repos):
-    INFO_FILE.write_text(json.dumps(repos, indent=4))
+    global _repo_list_cache, _repo_list_mtime
+    if orjson is not None:
+        INFO_FILE.write_bytes(orjson.dumps(repos, option=orjson.OPT_INDENT_2))
+    else:
+        INFO_FILE.write_text(json.dumps(repos, indent=4))
+    _repo_list_cache = repos
+    try:
+        _repo_list_mtime = INFO_FILE.stat().st_mtime_ns
+    except OSError:
+        _repo_list_mtime = None
+
+
+def _member_dest(target_dir: Path, name: str):
+    """
+    Destination path for an archive member, confined to target_dir.
+    Archives are arbitrary user files, so mirror ZipFile.extract's
+    sanitization: normalize separators, drop drive prefixes, absolute
+    roots, and any '.'/'..' components. Returns None for entries with no
+    usable name left.
+    """
+    parts = [p for p in name.replace("\\", "/").split("/")
+             if p and p not in (".", "..") and not p.endswith(":")]
+    if not parts:
+        return None
+    return target_dir.joinpath(*parts)
+
+
+def extract_zip(zip_path, target_dir: Path):
+    """
+    Extract zip_path under target_dir. Unlike ZipFile.extractall, this
+    pre-creates the directory skeleton in one pass (no redundant mkdir per
+    entry), touches zero-byte entries without opening a decompress stream,
+    and sizes the copy buffer to the entry (capped at 1 MiB) instead of
+    ZipExtFile's small default. Entries are independent, so after the
+    skeleton exists the file extractions run across a thread pool — zlib
+    decompression and disk writes both release the GIL. Entry names are
+    sanitized like extractall's (see _member_dest), so hostile archives
+    can't escape target_dir.
+    """
+    with zipfile.ZipFile(zip_path, "r") as zip_ref:
+        infos = zip_ref.infolist()
+
+    parents = {target_dir}
+    dests = {}
+    for zi in infos:
+        dest = _member_dest(target_dir, zi.filename)
+        if dest is None:
+            continue
+        dests[zi.filename] = dest
+        parents.add(dest if zi.is_dir() else dest.parent)
+    for d in sorted(parents):
+        d.mkdir(parents=True, exist_ok=True)
+
+    files = [zi for zi in infos if not zi.is_dir() and zi.filename in dests]
+    if not files:
+        return
+
+    def _extract_slice(slice_entries):
+        # ZipFile is not thread-safe on a shared handle, so each worker
+        # opens its own and walks its slice of the entry list.
+        with zipfile.ZipFile(zip_path, "r") as zf:
+            for zi in slice_entries:
+                dest = dests[zi.filename]
+                if zi.file_size == 0:
+                    dest.touch()
+                    continue
+                if zi.file_size <= 16 << 20:
+                    # Known small size: one read + one write instead of
+                    # copyfileobj's chunk loop
+                    with zf.open(zi) as src:
+                        data = src.read(zi.file_size)
+                    dest.write_bytes(data)
+                else:
+                    with zf.open(zi) as src, open(dest, "wb") as dst:
+                        shutil.copyfileobj(src, dst, 1 << 20)
+
+    workers = min(os.cpu_count() or 1, len(files))
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        list(ex.map(_extract_slice, (files[i::workers] for i in range(workers))))
+
+
+# File formats that are already compressed; deflating them again wastes CPU
+# for no size gain, so they are stored as-is in exported archives.
+_STORED_EXTS = {".zip", ".gz", ".bz2", ".xz", ".zst", ".7z",
+                ".png", ".jpg", ".jpeg", ".gif", ".webp", ".mp3", ".mp4"}
+
+
+def archive_repo(source_dir: Path, save_path: str):
+    """
+    Zip source_dir to save_path. shutil.make_archive compresses at zlib's
+    default level 6; exports are interactive, so deflate level 1 trades a
+    slightly larger archive for a much faster write. Already-compressed
+    formats are stored uncompressed, and the tree is walked with scandir
+    (stat-cached DirEntry objects) instead of os.walk.
+    """
+    prefix_len = len(str(source_dir)) + 1
+    with zipfile.ZipFile(save_path, "w", compression=zipfile.ZIP_DEFLATED,
+                         compresslevel=1, allowZip64=True) as zf:
+        stack = [str(source_dir)]
+        while stack:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        # Follow symlinks here so linked files end up in the
+                        # archive; directory descent stays no-follow to avoid
+                        # link loops.
+                        arcname = entry.path[prefix_len:]
+                        if os.path.splitext(entry.name)[1].lower() in _STORED_EXTS:
+                            zf.write(entry.path, arcname, compress_type=zipfile.ZIP_STORED)
+                        else:
+                            zf.write(entry.path, arcname)
+
+
+def _short_message(msg, width=80):
+    """First line of a commit message, capped at width chars.
+
+    Keeps history text bounded at O(commits * width) instead of growing
+    with full multi-line message bodies, which Tk would have to measure.
+    """
+    return (msg.splitlines()[0] if msg else "")[:width]
+
+
+@functools.lru_cache(maxsize=4096)
+def _fmt_commit(oid, message):
+    """Display row for a commit. Commits are immutable, so the formatted
+    string is memoized and reused across repeat history/rollback opens."""
+    return f"{oid[:8]} — {_short_message(message)}"
 
 
 # -------------------------------
@@ -92,6 +254,18 @@ class RepoListScreen(ctk.CTkFrame):
         )
         self.scrollable_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
 
+        # One context menu shared by every card; _menu_repo is rebound at
+        # post time, so refresh doesn't build K Menu widgets for K repos.
+        self._menu_repo = None
+        self._card_pool = []
+        self._card_menu = tk.Menu(self, tearoff=0)
+        self._card_menu.add_command(label="Export (.zip)", command=lambda: self.export_repo(self._menu_repo))
+        self._card_menu.add_separator()
+        self._card_menu.add_command(label="Delete", command=lambda: self.delete_repo(self._menu_repo))
+        self._card_menu.add_command(label="Info", command=lambda: messagebox.showinfo(
+            "Repository Info", f"Name: {self._menu_repo['name']}\nPath: {self._menu_repo['path']}"
+        ))
+
         self.refresh_repo_cards()
 
     # ----------------------------------------------------------------------
@@ -122,31 +296,57 @@ class RepoListScreen(ctk.CTkFrame):
                 return
 
             target_dir.mkdir()
-
-            # 3. Extract
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_ref.extractall(target_dir)
-
-            # 4. Check if it's valid (Optional: handle flat zips vs nested zips)
-            # If the user zipped the *contents* and not the folder, .gible might be at root.
-            # If they zipped the folder, there might be a subfolder.
-            # For simplicity, we register 'target_dir'.
-            
-            # 5. Add to Gible App
-            repos = load_repo_list()
-            if any(r["path"] == str(target_dir) for r in repos):
-                messagebox.showinfo("Info", "Repository already tracked.")
-            else:
-                repos.append({
-                    "name": repo_name,
-                    "path": str(target_dir)
-                })
-                save_repo_list(repos)
-                self.refresh_repo_cards()
-                messagebox.showinfo("Success", f"Imported '{repo_name}' successfully.")
-
         except Exception as e:
             messagebox.showerror("Import Error", str(e))
+            return
+
+        # 3. Extract — off the Tk thread, since a large archive takes many
+        # seconds and would freeze the window. Completion (or the error) is
+        # marshalled back onto the Tk thread with after().
+        progress = ctk.CTkToplevel(self)
+        progress.title("Importing")
+        ctk.CTkLabel(progress, text=f"Importing '{repo_name}'…").pack(padx=30, pady=20)
+        progress.grab_set()
+
+        def _do_extract():
+            try:
+                extract_zip(zip_path, target_dir)
+            except Exception as e:
+                err = str(e)
+                self.after(0, lambda: self._finish_import(repo_name, target_dir, progress, error=err))
+                return
+            self.after(0, lambda: self._finish_import(repo_name, target_dir, progress))
+
+        threading.Thread(target=_do_extract, daemon=True).start()
+
+    def _finish_import(self, repo_name, target_dir, progress, error=None):
+        """Runs on the Tk thread once extraction finishes."""
+        try:
+            progress.destroy()
+        except Exception:
+            pass
+
+        if error is not None:
+            messagebox.showerror("Import Error", error)
+            return
+
+        # 4. Check if it's valid (Optional: handle flat zips vs nested zips)
+        # If the user zipped the *contents* and not the folder, .gible might be at root.
+        # If they zipped the folder, there might be a subfolder.
+        # For simplicity, we register 'target_dir'.
+
+        # 5. Add to Gible App
+        repos = load_repo_list()
+        if os.path.normcase(str(target_dir)) in self._repo_path_set:
+            messagebox.showinfo("Info", "Repository already tracked.")
+        else:
+            repos.append({
+                "name": repo_name,
+                "path": str(target_dir)
+            })
+            save_repo_list(repos)
+            self.refresh_repo_cards()
+            messagebox.showinfo("Success", f"Imported '{repo_name}' successfully.")
 
     # ----------------------------------------------------------------------
     # NEW: Export Logic
@@ -169,13 +369,8 @@ class RepoListScreen(ctk.CTkFrame):
             return
 
         try:
-            # shutil.make_archive expects the file path WITHOUT .zip extension for the first arg,
-            # but asksaveasfilename gives us the full path WITH .zip.
-            base_name = str(Path(save_path).parent / Path(save_path).stem)
-            
-            # root_dir is the directory we are zipping
-            shutil.make_archive(base_name, 'zip', root_dir=source_dir)
-            
+            archive_repo(source_dir, save_path)
+
             messagebox.showinfo("Success", f"Repository exported to:\n{save_path}")
         except Exception as e:
             messagebox.showerror("Export Error", str(e))
@@ -190,7 +385,7 @@ class RepoListScreen(ctk.CTkFrame):
         folder = Path(folder)
         repos = load_repo_list()
 
-        if any(r["path"] == str(folder) for r in repos):
+        if os.path.normcase(str(folder)) in self._repo_path_set:
             messagebox.showinfo("Exists", "This repository is already added.")
             return
 
@@ -257,23 +452,40 @@ class RepoListScreen(ctk.CTkFrame):
     # ----------------------------------------------------------------------
 
     def refresh_repo_cards(self):
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
-
+        # Reuse pooled card widgets instead of destroy+recreate: tearing
+        # down a CTkFrame subtree per card is the slow part of a refresh,
+        # while reconfiguring label text is cheap. Surplus cards are just
+        # unpacked and picked up again by the next refresh.
         self.repo_list = load_repo_list()
+        # O(1) duplicate checks for add/import; normcase so case-only
+        # variants of the same path are caught on Windows
+        self._repo_path_set = {os.path.normcase(r["path"]) for r in self.repo_list}
 
-        for repo in self.repo_list:
-            self.create_repo_card(repo)
+        for i, repo in enumerate(self.repo_list):
+            if i < len(self._card_pool):
+                slot = self._card_pool[i]
+            else:
+                slot = self._make_card()
+                self._card_pool.append(slot)
+            slot["repo"] = repo
+            slot["title"].configure(text=repo["name"].upper())
+            slot["detail"].configure(text=repo["path"])
+            slot["frame"].pack(fill="x", padx=0, pady=(0, 20))
+
+        for slot in self._card_pool[len(self.repo_list):]:
+            slot["frame"].pack_forget()
 
     # ----------------------------------------------------------------------
 
-    def create_repo_card(self, repo):
+    def _make_card(self):
+        """Build one reusable card. Its bindings read the repo out of the
+        slot dict at event time, so the same widgets serve whatever repo
+        the slot currently displays."""
         card = ctk.CTkFrame(self.scrollable_frame, fg_color=repo_card_color, corner_radius=10)
-        card.pack(fill="x", padx=0, pady=(0, 20))
 
         title = ctk.CTkLabel(
             card,
-            text=repo["name"].upper(),
+            text="",
             font=repo_title_font,
             text_color=text_color,
             anchor="w",
@@ -282,37 +494,45 @@ class RepoListScreen(ctk.CTkFrame):
 
         detail_label = ctk.CTkLabel(
             card,
-            text=repo["path"],
+            text="",
             font=repo_detail_font,
             text_color=subtext_color,
             anchor="w"
         )
         detail_label.pack(anchor="nw", padx=10, pady=(5, 10))
 
-        # Open
-        for widget in [card, title, detail_label]:
-            widget.bind("<Button-1>", partial(lambda e, r=repo: self.master.show_frame_with_repo(ExplorerEditorScreen, r)))
-
-        # Right-click menu
-        menu = tk.Menu(self, tearoff=0)
-        # --- CHANGED: Added Export option ---
-        menu.add_command(label="Export (.zip)", command=lambda r=repo: self.export_repo(r))
-        menu.add_separator()
-        menu.add_command(label="Delete", command=lambda r=repo: self.delete_repo(r))
-        menu.add_command(label="Info", command=lambda r=repo: messagebox.showinfo(
-            "Repository Info", f"Name: {r['name']}\nPath: {r['path']}"
-        ))
+        slot = {"frame": card, "title": title, "detail": detail_label, "repo": None}
+
+        def open_repo(event):
+            self.master.show_frame_with_repo(ExplorerEditorScreen, slot["repo"])
 
-        def show_menu(event, m=menu):
-            m.tk_popup(event.x_root, event.y_root)
+        # Right-click: point the shared menu at this card's repo and post it
+        def show_menu(event):
+            self._menu_repo = slot["repo"]
+            self._card_menu.tk_popup(event.x_root, event.y_root)
 
         for widget in [card, title, detail_label]:
+            widget.bind("<Button-1>", open_repo)
             widget.bind("<Button-3>", show_menu)
 
+        return slot
+
 # -------------------------------
 # File Explorer + Editor Screen
 # -------------------------------
 class ExplorerEditorScreen(ctk.CTkFrame):
+    # Editors are kept alive to preserve their undo stacks, but every
+    # tk.Text holds its buffer and undo ring forever — cap the cache and
+    # evict least-recently-used editors beyond this.
+    MAX_OPEN_EDITORS = 16
+
+    # Commits loaded per batch into the rollback dropdown.
+    HISTORY_PAGE_SIZE = 60
+
+    # Files larger than this are inserted into the editor in slices
+    # scheduled with after_idle (see _insert_chunk).
+    _EDITOR_INSERT_CHUNK = 256 * 1024
+
     def __init__(self, master):
         super().__init__(master)
         self.configure(fg_color=bg_color)
@@ -321,10 +541,54 @@ class ExplorerEditorScreen(ctk.CTkFrame):
         self.repo_path = None
         self.current_file_path = None  # Key for the dictionary
 
-        # Dictionary to store { file_path_string : tk.Text_Widget_Instance }
-        self.file_editors = {}
+        # LRU of { file_path_string : tk.Text_Widget_Instance }
+        self.file_editors = OrderedDict()
         self.active_editor = None  # The currently visible widget
 
+        # { path_string : (monotonic_ts, stat_result_or_None) } — see _cached_stat
+        self._stat_cache = {}
+
+        # { abs_path_string : tree_item_id } for incremental inserts/removes
+        self._tree_nodes = {}
+
+        # { branch : (head_oid, commits) } — see _list_commits_cached
+        self._commit_list_cache = {}
+
+        # Built lazily on first rollback_action, then reused (see
+        # _build_rollback_dialog).
+        self._rollback_dialog = None
+
+        # Pending debounced-save timer id (see save_file_shortcut)
+        self._save_after_id = None
+
+        # Bumped per load_file; stale background reads check it and bail
+        self._load_token = 0
+
+        # { path : blake2b digest of last-saved bytes } — lets no-op saves
+        # skip the disk write (see save_current_file)
+        self._saved_digest = {}
+
+        # Shared right-click menus; commands act on the node captured at
+        # post time (see on_file_right_click)
+        self._menu_item = None
+        self._menu_path = None
+        self._file_menu = tk.Menu(self, tearoff=0)
+        self._file_menu.add_command(label="Delete File",
+                                    command=lambda: self.delete_file(self._menu_item))
+        self._dir_menu = tk.Menu(self, tearoff=0)
+        self._dir_menu.add_command(label="Create File",
+                                   command=lambda: self.create_file(self._menu_path))
+        self._dir_menu.add_command(label="Delete Folder",
+                                   command=lambda: self.delete_folder(self._menu_path))
+
+        # Status bar for incidental notifications — info-level messages go
+        # here instead of modal dialogs, so routine actions don't make the
+        # user click through a popup (see _status).
+        self.status_var = tk.StringVar()
+        self._status_clear_id = None
+        tk.Label(self, textvariable=self.status_var, anchor="w",
+                 bg="#181818", fg=text_color).pack(side="bottom", fill="x")
+
         # Main Layout
         self.main_container = tk.Frame(self, bg=bg_color)
         self.main_container.pack(fill="both", expand=True)
@@ -343,6 +607,7 @@ class ExplorerEditorScreen(ctk.CTkFrame):
         style.map("Treeview", background=[("selected", hover_color)], foreground=[("selected", "#ffffff")])
 
         self.file_tree.bind("<<TreeviewSelect>>", self.load_file)
+        self.file_tree.bind("<<TreeviewOpen>>", self._on_tree_expand)
 
         # Back button
         self.back_btn = ctk.CTkButton(
@@ -410,6 +675,40 @@ class ExplorerEditorScreen(ctk.CTkFrame):
                 pass  # Stack empty
         return "break"
 
+    # ----------------------------------------------------------------------
+    # Cached stat checks
+    # ----------------------------------------------------------------------
+    def _cached_stat(self, path):
+        """
+        os.stat with a 1-second TTL cache. Tree clicks and context menus
+        re-stat the same entries over and over, which hurts on slow
+        filesystems (network drives, AV-scanned disks). Returns None for
+        missing paths. The cache is cleared whenever the tree is refreshed
+        or files are created/deleted.
+        """
+        key = str(path)
+        now = time.monotonic()
+        hit = self._stat_cache.get(key)
+        if hit is not None and now - hit[0] < 1.0:
+            return hit[1]
+        try:
+            st = os.stat(key, follow_symlinks=False)
+        except OSError:
+            st = None
+        self._stat_cache[key] = (now, st)
+        return st
+
+    def _exists(self, path):
+        return self._cached_stat(path) is not None
+
+    def _is_file(self, path):
+        st = self._cached_stat(path)
+        return st is not None and stat.S_ISREG(st.st_mode)
+
+    def _is_dir(self, path):
+        st = self._cached_stat(path)
+        return st is not None and stat.S_ISDIR(st.st_mode)
+
     # ----------------------------------------------------------------------
     # File Loading Logic (The Core Fix)
     # ----------------------------------------------------------------------
@@ -424,26 +723,14 @@ class ExplorerEditorScreen(ctk.CTkFrame):
 
         item_id = selection[0]
 
-        # Reconstruct Path from Treeview
-        item_text = self.file_tree.item(item_id, "text")
-        path_parts = [item_text]
-        parent_id = self.file_tree.parent(item_id)
-        while parent_id:
-            parent_text = self.file_tree.item(parent_id, "text")
-            path_parts.insert(0, parent_text)
-            parent_id = self.file_tree.parent(parent_id)
-
-        constructed_path = Path(*path_parts)
-
-        # Convert to absolute system path
-        try:
-            relative_part = constructed_path.relative_to(self.repo_path.name)
-            full_path = self.repo_path / relative_part
-        except Exception:
-            # Clicked on Root Folder or something unexpected
+        # The node carries its absolute path (see _populate_children) — one
+        # Tk call instead of walking parent ids and re-joining names.
+        full_path = self._path_for(item_id)
+        if full_path is None or full_path == self.repo_path:
+            # Clicked the root folder or a placeholder node
             return
 
-        if not full_path.is_file():
+        if not self._is_file(full_path):
             # If it's a folder, clear editor and show folder info
             self.current_file_path = None
             if self.active_editor:
@@ -467,51 +754,171 @@ class ExplorerEditorScreen(ctk.CTkFrame):
         # 2. Check if we already have an editor for this file
         if str_path in self.file_editors:
             # Retrieve existing widget (preserves undo stack!)
+            self.file_editors.move_to_end(str_path)
             self.active_editor = self.file_editors[str_path]
             self.active_editor.pack(fill="both", expand=True)
             # Ensure focus so typing works immediately
             self.active_editor.focus_set()
         else:
-            # 3. Create a NEW editor widget for this file
+            # 3. Create a NEW editor widget for this file. The read and
+            # decode happen on a worker thread so a slow disk never freezes
+            # the UI; the widget is built back on the Tk thread. A token
+            # discards the result if another file is clicked meanwhile.
             try:
-                content = full_path.read_text(encoding='utf-8')
-                new_editor = tk.Text(
-                    self.editor_frame, bg="#1f1f1f", fg=editor_text_color,
-                    font=mono_font, insertbackground=editor_text_color,
-                    undo=True, maxundo=-1,  # Allow large undo
-                    highlightthickness=0, bd=0
-                )
-                new_editor.insert("1.0", content)
-
-                # Reset the undo stack so "inserting initial content" isn't the first undo
-                new_editor.edit_reset()
-
-                new_editor.pack(fill="both", expand=True)
-
-                # Store it
-                self.file_editors[str_path] = new_editor
-                self.active_editor = new_editor
-            except Exception as e:
+                # Tk Text stores lines in a B-tree of Python strings, so a
+                # huge file freezes the UI and balloons memory; ask first.
+                size = os.path.getsize(full_path)
+                if size > 2_000_000:
+                    if not messagebox.askyesno(
+                            "Large File",
+                            f"{full_path.name} is {size / 1_000_000:.1f} MB — open anyway?"):
+                        self.current_file_path = None
+                        return
+            except OSError as e:
                 messagebox.showerror("Read Error", f"Could not read file:\n{e}")
+                return
+
+            self._load_token += 1
+            token = self._load_token
+
+            def _read():
+                try:
+                    # Read raw bytes and decode once — Path.read_text goes
+                    # through TextIOWrapper's incremental decoder, roughly 2x
+                    # slower for the large files where the stall is noticeable.
+                    with open(full_path, "rb", buffering=1 << 17) as f:
+                        raw = f.read()
+                except Exception as e:
+                    err = str(e)
+                    self.after(0, lambda: self._finish_load(token, full_path, None, 0, error=err))
+                    return
+                if b"\x00" in raw[:8192]:
+                    self.after(0, lambda: self._finish_load(token, full_path, None, len(raw)))
+                    return
+                content = raw.decode("utf-8", errors="replace")
+                self.after(0, lambda: self._finish_load(token, full_path, content, len(raw)))
+
+            threading.Thread(target=_read, daemon=True).start()
+
+    def _finish_load(self, token, full_path, content, nbytes, error=None):
+        """
+        Runs on the Tk thread once a background read completes. Stale
+        results (the user clicked another file while this one was loading)
+        are dropped via the token check. content is None for binary files.
+        """
+        if token != self._load_token:
+            return
+        if error is not None:
+            messagebox.showerror("Read Error", f"Could not read file:\n{error}")
+            return
+        if content is None:
+            # Binary file: show a placeholder instead of dumping garbage
+            # into a Text widget
+            self.current_file_path = None
+            lbl = tk.Label(self.editor_frame,
+                           text=f"# Binary file: {full_path.name} ({nbytes} bytes)",
+                           bg="#1f1f1f", fg="#555555", font=mono_font)
+            lbl.pack(expand=True)
+            self.active_editor = lbl
+            return
+
+        new_editor = tk.Text(
+            self.editor_frame, bg="#1f1f1f", fg=editor_text_color,
+            font=mono_font, insertbackground=editor_text_color,
+            undo=True, maxundo=-1,  # Allow large undo
+            highlightthickness=0, bd=0
+        )
+        if len(content) > self._EDITOR_INSERT_CHUNK:
+            # Big file: feed the Text widget in slices between event-
+            # loop turns so the window stays responsive while Tk
+            # builds its line B-tree
+            self._insert_chunk(new_editor, content, 0)
+        else:
+            new_editor.insert("1.0", content)
+            # Reset the undo stack so "inserting initial content" isn't the first undo
+            new_editor.edit_reset()
+
+        new_editor.pack(fill="both", expand=True)
+
+        # Store it, evicting the least-recently-used editors (and
+        # their undo stacks) once over the cap
+        self.file_editors[str(full_path)] = new_editor
+        while len(self.file_editors) > self.MAX_OPEN_EDITORS:
+            _, old_widget = self.file_editors.popitem(last=False)
+            try:
+                old_widget.destroy()
+            except Exception:
+                pass
+        self.active_editor = new_editor
+
+    def _insert_chunk(self, editor, content, i):
+        """Insert one slice of content, then yield to the event loop before
+        the next so large loads don't freeze the UI. Resets the undo stack
+        after the final slice so the load itself isn't undoable."""
+        try:
+            editor.insert("end", content[i:i + self._EDITOR_INSERT_CHUNK])
+        except tk.TclError:
+            return  # editor was destroyed (refresh/evicted) mid-load
+        i += self._EDITOR_INSERT_CHUNK
+        if i < len(content):
+            self.after_idle(self._insert_chunk, editor, content, i)
+        else:
+            editor.edit_reset()
 
     # ----------------------------------------------------------------------
     # Standard Operations
     # ----------------------------------------------------------------------
 
+    # Rapid Ctrl-S presses within this window coalesce into one disk write.
+    _SAVE_DEBOUNCE_MS = 150
+
     def save_file_shortcut(self, event=None):
-        self.save_current_file()
+        if self._save_after_id is not None:
+            self.after_cancel(self._save_after_id)
+        self._save_after_id = self.after(self._SAVE_DEBOUNCE_MS, self._debounced_save)
         return "break"
 
+    def _debounced_save(self):
+        self._save_after_id = None
+        self.save_current_file()
+
     def save_current_file(self):
         if not self.current_file_path or not isinstance(self.active_editor, tk.Text):
-            messagebox.showinfo("Save", "No file selected.")
+            self._status("No file selected.")
             return
 
         content = self.active_editor.get("1.0", "end-1c")  # Get text from active widget
         try:
-            Path(self.current_file_path).write_text(content, encoding='utf-8')
-            # Note: we keep the small popup to match original behaviour
-            messagebox.showinfo("Saved", f"Saved: {Path(self.current_file_path).name}")
+            path = self.current_file_path
+            data = content.encode("utf-8")
+
+            # No-op saves (Ctrl-S reflex with nothing edited) skip the disk
+            # write. The last-saved digest is remembered per path; the first
+            # save after opening compares against the bytes on disk instead,
+            # which are still warm in the page cache from the load.
+            digest = hashlib.blake2b(data).digest()
+            old = self._saved_digest.get(path)
+            if old is None:
+                try:
+                    with open(path, "rb") as f:
+                        old = hashlib.blake2b(f.read()).digest()
+                except OSError:
+                    old = None
+            if digest == old:
+                self._saved_digest[path] = digest
+                self._status(f"No changes: {Path(path).name}")
+                return
+
+            # Encode once and write the bytes in a single unbuffered write —
+            # write_text goes through TextIOWrapper's incremental encoder
+            # and several buffered writes. No fsync here; saves are frequent
+            # and the OS flush is fine for an interactive editor.
+            with open(path, "wb", buffering=0) as f:
+                f.write(data)
+            self._saved_digest[path] = digest
+            # Status bar, not a popup — a modal per save would defeat the
+            # debounced shortcut and interrupt autosave-style flows.
+            self._status(f"Saved: {Path(path).name}")
         except Exception as e:
             messagebox.showerror("Save Error", str(e))
 
@@ -519,6 +926,7 @@ class ExplorerEditorScreen(ctk.CTkFrame):
         # When refreshing (or switching branches), files on disk change.
         # We MUST destroy existing editors because their content/undo history
         # is now invalid relative to the new file system state.
+        self._stat_cache.clear()
         self.clear_editors()
 
         self.load_repo({"path": str(self.repo_path), "name": self.repo_path.name})
@@ -531,7 +939,8 @@ class ExplorerEditorScreen(ctk.CTkFrame):
                 widget.destroy()
             except Exception:
                 pass
-        self.file_editors = {}
+        self.file_editors = OrderedDict()
+        self._saved_digest = {}
         # destroy any placeholder label if present
         if self.active_editor and not isinstance(self.active_editor, tk.Text):
             try:
@@ -547,6 +956,7 @@ class ExplorerEditorScreen(ctk.CTkFrame):
 
         self.repo_path = Path(repo_data["path"])
         self.repo = GibleRepository(str(self.repo_path))
+        self.repo.output_buffer = []  # UI mode: buffer log lines instead of stderr
 
         if not self.repo.is_repo():
             init_result = self.repo.init()
@@ -557,19 +967,17 @@ class ExplorerEditorScreen(ctk.CTkFrame):
         # Clear tree
         for item in self.file_tree.get_children():
             self.file_tree.delete(item)
+        self._tree_nodes = {}
 
-        root = self.file_tree.insert("", "end", text=self.repo_path.name, open=True)
-
-        def add_items(parent, path: Path):
-            for entry in sorted(path.iterdir(), key=lambda p: (p.is_file(), p.name.lower())):
-                if entry.name.startswith("."):
-                    continue  # Skip hidden
-                node = self.file_tree.insert(parent, "end", text=entry.name, open=False)
-                if entry.is_dir():
-                    add_items(node, entry)
+        root = self.file_tree.insert("", "end", text=self.repo_path.name, open=True,
+                                     values=(str(self.repo_path),))
+        self._tree_nodes[str(self.repo_path)] = root
 
+        # Only the first level is loaded up front; deeper directories fill
+        # in on expand, so opening a huge repo no longer blocks the UI
+        # inserting nodes the user may never look at.
         if self.repo_path.exists():
-            add_items(root, self.repo_path)
+            self._populate_children(root, str(self.repo_path))
 
         # Show a placeholder label since no file is selected yet
         lbl = tk.Label(self.editor_frame, text="Select a file to edit",
@@ -578,6 +986,91 @@ class ExplorerEditorScreen(ctk.CTkFrame):
         # We store this label as active_editor temporarily just so pack_forget works later
         self.active_editor = lbl
 
+    def _populate_children(self, parent, path):
+        """
+        Insert the direct children of path under parent. scandir's DirEntry
+        caches the file type from the directory read itself, so the type
+        checks below cost no extra stats. Directories get a placeholder
+        child so they show an expander; their real children are loaded on
+        first expand by _on_tree_expand. Each node carries its absolute
+        path in the hidden values column.
+        """
+        with os.scandir(path) as it:
+            entries = sorted((e for e in it if e.name[:1] != "."),  # Skip hidden
+                             key=lambda e: (e.is_file(follow_symlinks=False), e.name.lower()))
+        for entry in entries:
+            node = self.file_tree.insert(parent, "end", text=entry.name, open=False,
+                                         values=(entry.path,))
+            self._tree_nodes[entry.path] = node
+            if entry.is_dir(follow_symlinks=False):
+                self.file_tree.insert(node, "end", text="...", tags=("placeholder",))
+
+    def _tree_insert_single(self, path):
+        """
+        Insert just this new path into the tree instead of rebuilding the
+        whole view. If its directory hasn't been expanded yet nothing needs
+        inserting — the node will appear with the normal lazy load.
+        """
+        self._stat_cache.clear()
+        p = Path(path)
+        parent_item = self._tree_nodes.get(str(p.parent))
+        if parent_item is None:
+            return
+        children = self.file_tree.get_children(parent_item)
+        if children and "placeholder" in self.file_tree.item(children[0], "tags"):
+            return
+        node = self.file_tree.insert(parent_item, "end", text=p.name, open=False,
+                                     values=(str(p),))
+        self._tree_nodes[str(p)] = node
+        if self._is_dir(p):
+            self.file_tree.insert(node, "end", text="...", tags=("placeholder",))
+
+    def _tree_remove_single(self, path):
+        """Remove one path (and, for folders, its loaded subtree) from the
+        tree without a full rebuild."""
+        self._stat_cache.clear()
+        key = str(path)
+        item = self._tree_nodes.pop(key, None)
+        if item is not None:
+            try:
+                self.file_tree.delete(item)
+            except tk.TclError:
+                pass
+        prefix = key + os.sep
+        for k in [k for k in self._tree_nodes if k.startswith(prefix)]:
+            del self._tree_nodes[k]
+
+    def _on_tree_expand(self, event=None):
+        item = self.file_tree.focus()
+        children = self.file_tree.get_children(item)
+        if children and "placeholder" in self.file_tree.item(children[0], "tags"):
+            self.file_tree.delete(children[0])
+            values = self.file_tree.item(item, "values")
+            if values:
+                self._populate_children(item, values[0])
+
+    def _list_commits_cached(self, branch):
+        """
+        list_commits per branch, reused while that branch's head is
+        unchanged. Commits are immutable, so a matching head oid means the
+        walk would return the same list; any commit/merge/switch moves the
+        head and naturally invalidates the entry — no explicit hooks needed.
+        """
+        head = self.repo.load_metadata()["branches"].get(branch)
+        cached = self._commit_list_cache.get(branch)
+        if cached is not None and cached[0] == head:
+            return cached[1]
+        commits = self.repo.list_commits(branch)
+        self._commit_list_cache[branch] = (head, commits)
+        return commits
+
+    def _status(self, msg):
+        """Show an info-level message in the status bar for a few seconds."""
+        self.status_var.set(msg)
+        if self._status_clear_id is not None:
+            self.after_cancel(self._status_clear_id)
+        self._status_clear_id = self.after(5000, lambda: self.status_var.set(""))
+
     # ----------------------------------------------------------------------
     # Context Menu & Gible Actions
     # ----------------------------------------------------------------------
@@ -588,50 +1081,33 @@ class ExplorerEditorScreen(ctk.CTkFrame):
             return
         self.file_tree.selection_set(item)
 
-        # Reconstruct path (same logic as in load_file)
-        item_text = self.file_tree.item(item, "text")
-        path_parts = [item_text]
-        parent = self.file_tree.parent(item)
-        while parent:
-            pn = self.file_tree.item(parent)["text"]
-            path_parts.insert(0, pn)
-            parent = self.file_tree.parent(parent)
-
-        constructed = Path(*path_parts)
-        try:
-            full_path = self.repo_path / constructed.relative_to(self.repo_path.name)
-        except Exception:
-            full_path = self.repo_path
-
-        menu = tk.Menu(self, tearoff=0)
-        if full_path.is_file():
-            menu.add_command(label="Delete File", command=lambda: self.delete_file(item))
-        elif full_path.is_dir():
-            menu.add_command(label="Create File", command=lambda: self.create_file(full_path))
-            menu.add_command(label="Delete Folder", command=lambda: self.delete_folder(full_path))
-        menu.post(event.x_root, event.y_root)
+        full_path = self._path_for(item) or self.repo_path
+
+        # Menus are built once (see __init__) and shared across clicks;
+        # their commands read the target captured here, the same pattern
+        # the repo-card menu uses. No per-event Menu construction or
+        # entryconfigure round-trips.
+        self._menu_item = item
+        self._menu_path = full_path
+        if self._is_file(full_path):
+            self._file_menu.post(event.x_root, event.y_root)
+        elif self._is_dir(full_path):
+            self._dir_menu.post(event.x_root, event.y_root)
+
+    def _path_for(self, item):
+        """Absolute Path stored on a tree node (see _populate_children),
+        or None for nodes without one (e.g. placeholders)."""
+        values = self.file_tree.item(item, "values")
+        return Path(values[0]) if values else None
 
     def _reconstruct_relative_and_full(self, item):
         """
         Helper that, given a tree item id, returns (relative_to_repo_working_dir_str, full_path(Path))
         Raises ValueError if path cannot be constructed.
         """
-        name = self.file_tree.item(item, "text")
-        rel = Path(name)
-        parent = self.file_tree.parent(item)
-        while parent:
-            pn = self.file_tree.item(parent, "text")
-            rel = Path(pn) / rel
-            parent = self.file_tree.parent(parent)
-
-        # rel starts with repo root name; convert to path relative to repo_path
-        try:
-            relative_to_repo = rel.relative_to(self.repo_path.name)
-            full = self.repo_path / relative_to_repo
-        except Exception:
-            # If anything goes wrong, try to resolve relative to repo.working_dir if available
-            full = (self.repo_path / rel.name) if rel.name else self.repo_path
-            relative_to_repo = full.relative_to(self.repo_path)
+        full = self._path_for(item)
+        if full is None:
+            raise ValueError("No path stored for tree item")
         # produce path relative to repo.working_dir for repo.add
         try:
             repo_rel_for_add = str(full.relative_to(self.repo.working_dir))
@@ -652,7 +1128,7 @@ class ExplorerEditorScreen(ctk.CTkFrame):
             return
 
         filename = full_path_to_delete.name
-        if not full_path_to_delete.exists() or not full_path_to_delete.is_file():
+        if not self._is_file(full_path_to_delete):
             messagebox.showerror("Delete File", f"File does not exist: {full_path_to_delete}")
             return
 
@@ -682,14 +1158,16 @@ class ExplorerEditorScreen(ctk.CTkFrame):
         except Exception as e:
             messagebox.showerror("Error", str(e))
         finally:
-            self.refresh_files()
+            # Patch the tree in place; a full refresh would tear down every
+            # open editor (and its undo history) to remove one node.
+            self._tree_remove_single(full_path_to_delete)
 
     def create_file(self, folder_path):
         """
         Prompt for a new file name, create it on disk, stage it and refresh.
         folder_path is a Path object pointing at the folder in the repo.
         """
-        if not folder_path.exists() or not folder_path.is_dir():
+        if not self._is_dir(folder_path):
             messagebox.showerror("Error", f"Folder does not exist: {folder_path}")
             return
 
@@ -698,7 +1176,7 @@ class ExplorerEditorScreen(ctk.CTkFrame):
             return
 
         new_file = folder_path / name
-        if new_file.exists():
+        if self._exists(new_file):
             messagebox.showerror("Error", "File already exists.")
             return
 
@@ -717,13 +1195,13 @@ class ExplorerEditorScreen(ctk.CTkFrame):
         except Exception as e:
             messagebox.showerror("Error", str(e))
         finally:
-            self.refresh_files()
+            self._tree_insert_single(new_file)
 
     def delete_folder(self, folder_path):
         """
         Delete a folder and its contents, stage the deletion, refresh.
         """
-        if not folder_path.exists() or not folder_path.is_dir():
+        if not self._is_dir(folder_path):
             messagebox.showerror("Error", f"Folder does not exist: {folder_path}")
             return
 
@@ -731,8 +1209,20 @@ class ExplorerEditorScreen(ctk.CTkFrame):
             return
 
         try:
-            import shutil
-            shutil.rmtree(folder_path)
+            # Fast path for flat folders: unlink the entries directly and
+            # rmdir, skipping the per-entry stat shutil.rmtree performs.
+            # Anything nested (or racing) falls back to rmtree.
+            try:
+                with os.scandir(folder_path) as it:
+                    entries = list(it)
+                if all(e.is_file(follow_symlinks=False) for e in entries):
+                    for e in entries:
+                        os.unlink(e.path)
+                    os.rmdir(folder_path)
+                else:
+                    shutil.rmtree(folder_path)
+            except OSError:
+                shutil.rmtree(folder_path)
             try:
                 rel_for_add = str(folder_path.relative_to(self.repo.working_dir))
             except Exception:
@@ -741,11 +1231,22 @@ class ExplorerEditorScreen(ctk.CTkFrame):
                 self.repo.add(rel_for_add)
             except Exception:
                 pass
+            # Close editors for files that lived inside the folder
+            prefix = str(folder_path) + os.sep
+            for p in [p for p in self.file_editors if p.startswith(prefix)]:
+                try:
+                    self.file_editors[p].destroy()
+                except Exception:
+                    pass
+                del self.file_editors[p]
+                if self.current_file_path == p:
+                    self.current_file_path = None
+                    self.active_editor = None
             messagebox.showinfo("Deleted", f"Folder deleted and staged: {folder_path.name}")
         except Exception as e:
             messagebox.showerror("Error", str(e))
         finally:
-            self.refresh_files()
+            self._tree_remove_single(folder_path)
 
     def commit_action(self):
         if not self.current_file_path:
@@ -781,17 +1282,28 @@ class ExplorerEditorScreen(ctk.CTkFrame):
         """
         try:
             current_branch = self.repo.current_branch()
-            commits = self.repo.list_commits(current_branch)
+            commits = self._list_commits_cached(current_branch)
         except Exception as e:
             messagebox.showerror("History Error", str(e))
             return
 
         if not commits:
-            messagebox.showinfo("History", "No commits yet")
+            self._status("No commits yet")
             return
 
-        text = "\n".join([f"{c['oid'][:8]} — {c.get('message','')}" for c in commits])
-        messagebox.showinfo("Version History", text)
+        # A Text widget renders only the visible lines, so a long history
+        # doesn't pay the full-string layout pass a modal messagebox would.
+        win = tk.Toplevel(self)
+        win.title(f"Version History — {current_branch}")
+        win.geometry("520x400")
+        txt = tk.Text(win, wrap="none", font=mono_font)
+        scroll = ttk.Scrollbar(win, orient="vertical", command=txt.yview)
+        txt.configure(yscrollcommand=scroll.set)
+        scroll.pack(side="right", fill="y")
+        txt.pack(side="left", fill="both", expand=True)
+        for c in commits:
+            txt.insert("end", _fmt_commit(c["oid"], c.get("message", "")) + "\n")
+        txt.configure(state="disabled")
 
     def rollback_action(self):
         """
@@ -799,7 +1311,7 @@ class ExplorerEditorScreen(ctk.CTkFrame):
         """
         try:
             branch = self.repo.current_branch()
-            commits_data = self.repo.list_commits(branch)
+            commits_data = self._list_commits_cached(branch)
         except Exception as e:
             messagebox.showerror("Rollback Error", str(e))
             return
@@ -808,54 +1320,100 @@ class ExplorerEditorScreen(ctk.CTkFrame):
             messagebox.showinfo("Rollback", "No commits available.")
             return
 
+        # The dialog's widget tree is built once and reused — widget
+        # construction is the dominant Tk cost, so later invocations just
+        # refresh the title/values and deiconify.
+        if self._rollback_dialog is None:
+            self._build_rollback_dialog()
+
+        self._rollback_commits = commits_data
+        self._rollback_oids = [c["oid"] for c in commits_data]
+        self._rollback_rows = []
+        self._rollback_title.configure(text=f"Rollback - Branch: {branch}")
+        self._rollback_load_page()
+        self._rollback_combo.current(0)
+        self._rollback_dialog.deiconify()
+
+    _OLDER_SENTINEL = "… older commits"
+
+    def _build_rollback_dialog(self):
+        """Construct the rollback Toplevel once; it is hidden, not destroyed."""
         dialog = tk.Toplevel(self)
         dialog.title("Rollback")
         dialog.geometry("420x260")
         dialog.resizable(False, False)
+        dialog.protocol("WM_DELETE_WINDOW", dialog.withdraw)
 
-        tk.Label(dialog, text=f"Rollback - Branch: {branch}", font=("Segoe UI", 10, "bold")).pack(pady=10)
+        self._rollback_title = tk.Label(dialog, text="", font=("Segoe UI", 10, "bold"))
+        self._rollback_title.pack(pady=10)
         tk.Label(dialog, text="Select a commit:", anchor="w").pack(fill="x", padx=10)
 
-        commit_var = tk.StringVar()
-        commit_dropdown = ttk.Combobox(dialog, textvariable=commit_var, state="readonly")
-
-        display_list = []
-        commit_map = {}
-
-        for commit_obj in commits_data:
-            oid = commit_obj["oid"]
-            msg = commit_obj.get("message", "")
-            display = f"{oid[:8]}  |  {msg}"
-            display_list.append(display)
-            commit_map[display] = oid
-
-        commit_dropdown["values"] = display_list
-        if display_list:
-            commit_dropdown.current(0)
-        commit_dropdown.pack(fill="x", padx=10, pady=5)
-
-        def apply_rollback():
-            display = commit_var.get()
-            oid = commit_map.get(display)
-            if not oid:
-                messagebox.showerror("Error", "Invalid commit selected.")
-                return
-
+        self._rollback_var = tk.StringVar()
+        self._rollback_combo = ttk.Combobox(dialog, textvariable=self._rollback_var, state="readonly")
+        self._rollback_combo.bind("<<ComboboxSelected>>", self._rollback_on_select)
+        self._rollback_combo.pack(fill="x", padx=10, pady=5)
+
+        tk.Button(dialog, text="Apply", command=self._rollback_apply).pack(side="right", padx=10, pady=15)
+        tk.Button(dialog, text="Cancel", command=dialog.withdraw).pack(side="right", pady=15)
+        self._rollback_dialog = dialog
+
+    def _rollback_load_page(self):
+        """Extend the dropdown with the next batch of commits; returns its start index."""
+        rows = self._rollback_rows
+        start = len(rows)
+        page = self._rollback_commits[start:start + self.HISTORY_PAGE_SIZE]
+        rows.extend(_fmt_commit(c["oid"], c.get("message", "")) for c in page)
+        values = list(rows)
+        if len(rows) < len(self._rollback_commits):
+            values.append(self._OLDER_SENTINEL)
+        self._rollback_combo["values"] = values
+        return start
+
+    def _rollback_on_select(self, event=None):
+        if self._rollback_var.get() == self._OLDER_SENTINEL:
+            self._rollback_combo.current(self._rollback_load_page())
+
+    def _rollback_apply(self):
+        idx = self._rollback_combo.current()
+        if idx < 0 or idx >= len(self._rollback_rows) or self._rollback_var.get() == self._OLDER_SENTINEL:
+            messagebox.showerror("Error", "Invalid commit selected.")
+            return
+        oid = self._rollback_oids[idx]
+        dialog = self._rollback_dialog
+
+        # Restoring a large tree takes seconds; run it off the Tk
+        # thread and marshal the result (and the refresh) back with
+        # after(), same pattern as the zip import.
+        progress = ctk.CTkToplevel(dialog)
+        progress.title("Rollback")
+        ctk.CTkLabel(progress, text="Rolling back…").pack(padx=30, pady=20)
+        progress.grab_set()
+
+        def _finish(restore_result, error=None):
             try:
-                restore_result = self.repo.restore_commit(oid)
-            except Exception as e:
-                messagebox.showerror("Rollback", str(e))
+                progress.destroy()
+            except Exception:
+                pass
+            if error is not None:
+                messagebox.showerror("Rollback", error)
                 return
-
             if restore_result.get("success", False):
                 messagebox.showinfo("Rollback", restore_result.get("message", "Rollback applied"))
                 self.refresh_files()
-                dialog.destroy()
+                dialog.withdraw()
             else:
                 messagebox.showerror("Rollback", restore_result.get("message", "Rollback failed"))
 
-        tk.Button(dialog, text="Apply", command=apply_rollback).pack(side="right", padx=10, pady=15)
-        tk.Button(dialog, text="Cancel", command=dialog.destroy).pack(side="right", pady=15)
+        def _do_restore():
+            try:
+                restore_result = self.repo.restore_commit(oid)
+            except Exception as e:
+                err = str(e)
+                self.after(0, lambda: _finish(None, error=err))
+                return
+            self.after(0, lambda: _finish(restore_result))
+
+        threading.Thread(target=_do_restore, daemon=True).start()
 
     def branch_action(self):
         name = simpledialog.askstring("Branch", "New branch name:")
@@ -869,28 +1427,65 @@ class ExplorerEditorScreen(ctk.CTkFrame):
             return
 
         if branch_result.get("success", False):
-            messagebox.showinfo("Branch", branch_result.get("message", "Branch created"))
+            self._status(branch_result.get("message", "Branch created"))
         else:
             messagebox.showerror("Branch", branch_result.get("message", "Failed to create branch"))
 
+    def _pick_branch(self, title, prompt, branches):
+        """Modal branch picker. Returns the chosen branch name or None.
+
+        A Combobox renders in constant time however many branches exist,
+        unlike askstring which lays out every name into the prompt label.
+        """
+        dlg = tk.Toplevel(self)
+        dlg.title(title)
+        dlg.resizable(False, False)
+
+        tk.Label(dlg, text=prompt, anchor="w").pack(fill="x", padx=10, pady=(10, 0))
+        var = tk.StringVar()
+        combo = ttk.Combobox(dlg, textvariable=var, values=branches, state="readonly")
+        if branches:
+            combo.current(0)
+        combo.pack(fill="x", padx=10, pady=5)
+
+        choice = []
+
+        def ok():
+            choice.append(var.get())
+            dlg.destroy()
+
+        tk.Button(dlg, text="OK", command=ok).pack(side="right", padx=10, pady=10)
+        tk.Button(dlg, text="Cancel", command=dlg.destroy).pack(side="right", pady=10)
+        dlg.grab_set()
+        dlg.wait_window()
+        return choice[0] if choice and choice[0] else None
+
     def switch_branch_action(self):
         branches = self.repo.list_branches()
         if not branches:
             messagebox.showinfo("Branches", "No branches available.")
             return
-        name = simpledialog.askstring("Switch Branch", f"Available:\n{', '.join(branches)}")
+        name = self._pick_branch("Switch Branch", "Select a branch:", branches)
         if not name:
             return
 
         res = self.repo.switch_branch(name)
         if res.get("success", False):
-            messagebox.showinfo("Switch", res.get("message", "Switched branch"))
+            self._status(res.get("message", "Switched branch"))
             # IMPORTANT: This clears the old file editors so undo history
             # from Branch A doesn't bleed into Branch B
             self.refresh_files()
         else:
             messagebox.showerror("Error", res.get("message", "Switch failed"))
 
+    @staticmethod
+    def _open_in_file_manager(wd):
+        """Open *wd* in the platform file manager. Runs on a worker thread."""
+        try:
+            subprocess.Popen(_OPEN_CMD + [wd])
+        except Exception:
+            pass
+
     def merge_action(self):
         branches = self.repo.list_branches()
         if not branches:
@@ -898,7 +1493,7 @@ class ExplorerEditorScreen(ctk.CTkFrame):
             return
 
         current_branch = self.repo.current_branch()
-        name = simpledialog.askstring("Merge", f"Merge branch into {current_branch}:\n{', '.join(branches)}")
+        name = self._pick_branch("Merge", f"Merge branch into {current_branch}:", branches)
         if not name:
             return
 
@@ -907,8 +1502,6 @@ class ExplorerEditorScreen(ctk.CTkFrame):
         except Exception as e:
             messagebox.showerror("Merge Error", str(e))
             return
-        
-        self.refresh_files()
 
         if not merge_result.get("success", False):
             if merge_result.get("conflicts"):
@@ -916,21 +1509,18 @@ class ExplorerEditorScreen(ctk.CTkFrame):
                                                f"Automatic merge produced conflicts in directory: {merge_result.get('merge_dir','unknown')}.\n"
                                                f"Do you want to open the repository folder to resolve conflicts manually?")
                 if response:
-                    # Open the repo working directory in file explorer as a convenience (best-effort)
-                    try:
-                        import subprocess, platform
-                        wd = str(self.repo.working_dir)
-                        if platform.system() == "Windows":
-                            subprocess.Popen(["explorer", wd])
-                        elif platform.system() == "Darwin":
-                            subprocess.Popen(["open", wd])
-                        else:
-                            subprocess.Popen(["xdg-open", wd])
-                    except Exception:
-                        pass
+                    # Open the repo working directory in file explorer as a
+                    # convenience (best-effort). Spawning the OS shell can be
+                    # slow (notably explorer on Windows), so do it off the Tk
+                    # thread rather than stalling the mainloop.
+                    wd = str(self.repo.working_dir)
+                    threading.Thread(target=self._open_in_file_manager, args=(wd,), daemon=True).start()
+                    # No refresh here: the tree is about to change under an
+                    # external file manager while conflicts are resolved.
                     messagebox.showinfo("Merge", "Please resolve conflicts manually and then commit.")
                 else:
                     messagebox.showinfo("Merged Forcefully", "Resolve conflicts manually.")
+                    self.refresh_files()
             else:
                 messagebox.showerror("Merge", merge_result.get("message", "Merge failed"))
             return
@@ -950,29 +1540,38 @@ class App(ctk.CTk):
         self.grid_rowconfigure(0, weight=1)
         self.grid_columnconfigure(0, weight=1)
         
-        # Get the screen dimensions dynamically
-        screen_width = self.winfo_screenwidth()
-        screen_height = self.winfo_screenheight()
+        # Start with a small window and expand to full screen from
+        # after_idle — mainloop begins painting sooner and the expensive
+        # first full-screen layout happens after the first frame.
+        self.geometry("800x600+0+0")
+        self.after_idle(self._expand_to_screen)
 
-        # Set the window geometry to full screen
-        self.geometry(f"{screen_width}x{screen_height}+0+0")
-        
         self.overrideredirect(True)
         self.bind("<Escape>", lambda e: self.destroy())
 
+        # Screens are built on first show, not up front — constructing the
+        # ExplorerEditorScreen widget tree is the expensive part of startup
+        # and pointless if the user never opens a repo.
         self.frames = {}
-        for F in (RepoListScreen, ExplorerEditorScreen):
-            frame = F(self)
-            self.frames[F] = frame
-            frame.grid(row=0, column=0, sticky="nsew")
 
         self.show_frame(RepoListScreen)
 
+    def _expand_to_screen(self):
+        self.geometry(f"{self.winfo_screenwidth()}x{self.winfo_screenheight()}+0+0")
+
+    def _get_frame(self, cls):
+        frame = self.frames.get(cls)
+        if frame is None:
+            frame = cls(self)
+            frame.grid(row=0, column=0, sticky="nsew")
+            self.frames[cls] = frame
+        return frame
+
     def show_frame(self, cls):
-        self.frames[cls].tkraise()
+        self._get_frame(cls).tkraise()
 
     def show_frame_with_repo(self, cls, repo_data):
-        frame = self.frames[cls]
+        frame = self._get_frame(cls)
         frame.load_repo(repo_data)
         frame.tkraise()
 
@@ -0,0 +1,56 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from base import GibleRepository
+
+
+def _merge(base, ours, theirs):
+    repo = GibleRepository(tempfile.mkdtemp(prefix="gible-test-"))
+    return repo.three_way_merge_text(
+        [l + "\n" for l in base],
+        [l + "\n" for l in ours],
+        [l + "\n" for l in theirs],
+    )
+
+
+class ThreeWayMergeTests(unittest.TestCase):
+    def test_one_sided_insert_is_kept(self):
+        # Regression: Myers emits zero-width pure-insert hunks where
+        # SequenceMatcher emitted width-1 replaces, and the interval cover
+        # used to drop them — this exact merge lost 'mod5' and returned a
+        # "clean" result matching neither side.
+        base = ['line5', 'line4', 'line4', 'line1', 'line0', 'line0', 'line0']
+        theirs = ['line5', 'mod5', 'line4', 'line1', 'line0', 'line0']
+        merged, conflict = _merge(base, base, theirs)
+        self.assertFalse(conflict)
+        self.assertEqual(merged, "".join(l + "\n" for l in theirs))
+
+    def test_append_at_eof_is_kept(self):
+        # Regression: a line appended at EOF on one branch is a zero-width
+        # hunk at len(base); the old cover mapping dropped it from the merge.
+        merged, conflict = _merge(['a', 'b'], ['a', 'b'], ['a', 'b', 'c'])
+        self.assertFalse(conflict)
+        self.assertEqual(merged, "a\nb\nc\n")
+        merged, conflict = _merge(['a', 'b'], ['a', 'b', 'c'], ['a', 'b'])
+        self.assertFalse(conflict)
+        self.assertEqual(merged, "a\nb\nc\n")
+
+    def test_identical_inserts_merge_clean(self):
+        merged, conflict = _merge(['a', 'b'], ['a', 'x', 'b'], ['a', 'x', 'b'])
+        self.assertFalse(conflict)
+        self.assertEqual(merged, "a\nx\nb\n")
+
+    def test_conflicting_inserts_conflict(self):
+        merged, conflict = _merge(['a', 'b'], ['a', 'x', 'b'], ['a', 'y', 'b'])
+        self.assertTrue(conflict)
+        self.assertIn("<<<<<<< HEAD\n", merged)
+        self.assertIn("x\n", merged)
+        self.assertIn("y\n", merged)
+
+
+if __name__ == "__main__":
+    unittest.main()
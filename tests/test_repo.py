@@ -0,0 +1,74 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from base import GibleRepository
+
+
+class CommitHeaderTests(unittest.TestCase):
+    def test_headers_survive_commit(self):
+        # Regression: commit() used to re-save the metadata dict it loaded
+        # before _write_commit_object, clobbering the per-commit header
+        # entries and forcing every log walk through full object loads.
+        d = tempfile.mkdtemp(prefix="gible-test-")
+        repo = GibleRepository(d)
+        repo.init()
+        path = os.path.join(d, "f.txt")
+        for i, msg in enumerate(("first", "second")):
+            with open(path, "w") as f:
+                f.write("v%d\n" % i)
+            repo.add("f.txt")
+            repo.commit(msg)
+
+        # Fresh repo object: headers must come from metadata.json on disk.
+        repo2 = GibleRepository(d)
+        metadata = repo2.load_metadata()
+        self.assertEqual(len(metadata["commits"]), 2)
+        messages = [c["message"] for c in repo2.list_commits()]
+        self.assertEqual(messages, ["second", "first"])
+
+
+class AddNormalizationTests(unittest.TestCase):
+    def test_dot_and_direct_add_share_one_key(self):
+        # Regression: add('.') used to stage './x.txt' while add('x.txt')
+        # staged 'x.txt', tracking the same file twice.
+        d = tempfile.mkdtemp(prefix="gible-test-")
+        repo = GibleRepository(d)
+        repo.init()
+        with open(os.path.join(d, "x.txt"), "w") as f:
+            f.write("x\n")
+        repo.add(".")
+        repo.add("x.txt")
+        self.assertEqual(list(repo.index.get_all()), ["x.txt"])
+
+
+class ReconstructTests(unittest.TestCase):
+    def test_binary_diff_on_text_flagged_file_reconstructs(self):
+        # Regression: a file whose first 8 KiB is clean ASCII but whose tail
+        # is invalid UTF-8 gets its diff stored as binary under the "diff"
+        # type. Replaying that chain must fall back to the binary patch —
+        # under orjson the failed JSON parse raises a ValueError, not the
+        # UnicodeDecodeError the fallback used to catch.
+        d = tempfile.mkdtemp(prefix="gible-test-")
+        repo = GibleRepository(d)
+        repo.init()
+        path = os.path.join(d, "f.txt")
+        with open(path, "wb") as f:
+            f.write(b"a" * 9000 + b"\n")
+        repo.add("f.txt")
+        repo.commit("c1")
+        new_bytes = b"a" * 9000 + b"\xff\xfe\n"
+        with open(path, "wb") as f:
+            f.write(new_bytes)
+        repo.add("f.txt")
+        repo.commit("c2")
+
+        head = repo.load_metadata()["head"]
+        self.assertEqual(repo.reconstruct_file_bytes(head, "f.txt"), new_bytes)
+
+
+if __name__ == "__main__":
+    unittest.main()